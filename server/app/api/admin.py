@@ -11,10 +11,11 @@ import json
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from app.api.anchor import invalidate_anchor_caches
 from app.core.audit import log_action
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user_id
+from app.core.dependencies import forget_cached_user, get_current_user_id
 from app.schemas.admin import (
     AdminReportResponse, 
     ResolveReportRequest, 
@@ -150,6 +151,8 @@ def resolve_report(
         )
 
     db.commit()
+    if body.delete_anchor:
+        invalidate_anchor_caches(report.anchor_id)
 
     return {"message": f"Report {new_status.lower()}", "report_id": report_id, "anchor_deleted": body.delete_anchor}
 
@@ -232,17 +235,16 @@ def set_user_ban_status(
         db.execute(
             text("""
                 UPDATE user_sessions
-                SET revoked_at = :now
+                SET revoked_at = UTC_TIMESTAMP()
                 WHERE user_id = :target_user_id
                   AND revoked_at IS NULL
             """),
-            {
-                "now": datetime.utcnow(),
-                "target_user_id": target_user_id,
-            },
+            {"target_user_id": target_user_id},
         )
 
     db.commit()
+    forget_cached_user(target_user_id)
+    invalidate_anchor_caches()
 
     log_action(
         db,
@@ -7,42 +7,164 @@ US12 #3 — Sort by distance, filter locked/unlocked, public/private
 Endpoints:
     POST   /anchors                    — create a new Anchor tied to a location
     GET    /anchors/nearby             — list nearby anchors sorted by distance with filters
+    GET    /anchors/nearby/summary     — lean nearby list (id, title, position, status, distance)
     PATCH  /anchors/{anchor_id}        — update an existing Anchor (owner only)
     DELETE /anchors/{anchor_id}        — delete an Anchor (owner only)
     POST   /anchors/{anchor_id}/unlock — unlock an Anchor (checks activation window)
 """
 
-import json
-import uuid
+import base64
+import binascii
+import math
+import threading
 from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Tuple
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional, List, Dict, Tuple, get_args
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.core.audit import log_action
 from pydantic import BaseModel as PydanticBaseModel
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import get_current_user_id
+from app.core.ids import uuid7
 from app.schemas.anchor import (
+    ANCHOR_LIST_ADAPTER,
+    ANCHOR_LIST_ITEM_ADAPTER,
     CreateAnchorRequest,
     UpdateAnchorRequest,
     AnchorFilterOption,
     AnchorFilterOptionsResponse,
+    AnchorListItem,
     AnchorResponse,
+    AnchorStatus,
+    AnchorVisibility,
 )
 
 router = APIRouter(prefix="/anchors", tags=["Anchors"])
 
-VALID_VISIBILITY = {"PUBLIC", "PRIVATE", "CIRCLE_ONLY"}
-VALID_ANCHOR_STATUS = {"ACTIVE", "EXPIRED", "LOCKED", "FLAGGED"}
-VALID_CONTENT_TYPES = {"TEXT", "FILE", "LINK"}
+# Query-string filters are matched case-insensitively against these; request
+# bodies are validated by the Literal types in app.schemas.anchor instead
+VALID_VISIBILITY = frozenset(get_args(AnchorVisibility))
+VALID_ANCHOR_STATUS = frozenset(get_args(AnchorStatus))
+VALID_CONTENT_TYPES = frozenset({"TEXT", "FILE", "LINK"})
+
+# Approximate length of one degree of latitude, used to size the nearby bounding box
+METERS_PER_DEGREE_LAT = 111_320.0
+
+# Upper bound on nearby search radius, and page size for /nearby keyset pagination
+NEARBY_MAX_RADIUS_KM = 100.0
+NEARBY_DEFAULT_PAGE_SIZE = 100
+NEARBY_MAX_PAGE_SIZE = 500
+
+# Guarded unlock UPDATEs per request; a retry only happens when the anchor changed
+# between the UPDATE and the read used to explain why it matched nothing
+UNLOCK_ATTEMPTS = 2
+
+# Serialized /nearby responses keyed per user and (lat, lon) snapped to 5 decimals (~1 m).
+# Disabled unless NEARBY_CACHE_TTL_SECONDS > 0; cleared on every anchor or content write.
+NEARBY_CACHE_COORD_PRECISION = 5
+_nearby_cache: TTLCache = TTLCache(
+    maxsize=settings.NEARBY_CACHE_MAX_ENTRIES,
+    ttl=max(settings.NEARBY_CACHE_TTL_SECONDS, 1),
+)
+_nearby_cache_lock = threading.Lock()
+
+# Non-ACTIVE anchors, used only to reject unlock attempts without a DB read.
+# Only the status is trusted from here — activation windows are always checked
+# against the database clock — and every status writer evicts its entry.
+# Disabled unless UNLOCK_GATE_CACHE_TTL_SECONDS > 0.
+_unlock_gate_cache: TTLCache = TTLCache(
+    maxsize=settings.UNLOCK_GATE_CACHE_MAX_ENTRIES,
+    ttl=max(settings.UNLOCK_GATE_CACHE_TTL_SECONDS, 1),
+)
+_unlock_gate_cache_lock = threading.Lock()
 
 class VoteRequest(PydanticBaseModel):
     vote: str
 
+# ── Statements ────────────────────────────────────────────────────────────────
+# Static SQL is built once at import so SQLAlchemy's compiled-statement cache
+# hits on every call instead of re-parsing a fresh TextClause per request.
+
+_SELECT_ANCHOR_BY_ID = text("""
+    SELECT a.anchor_id, a.creator_id, a.circle_id, a.title, a.description,
+           ST_X(a.location) AS longitude, ST_Y(a.location) AS latitude,
+           a.altitude, a.status, a.visibility, a.unlock_radius,
+           a.max_unlock, a.current_unlock, a.activation_time,
+           a.expiration_time, a.tags, a.is_savable,
+           (
+               SELECT GROUP_CONCAT(DISTINCT c.content_type ORDER BY c.content_type SEPARATOR ',')
+               FROM Content c
+               WHERE c.anchor_id = a.anchor_id
+           ) AS content_type
+    FROM anchors a
+    WHERE a.anchor_id = :anchor_id
+""")
+
+_SELECT_GHOST_MODE = text("SELECT is_ghost_mode FROM users WHERE user_id = :user_id")
+
+_ANCHOR_EXISTS = text("SELECT 1 FROM anchors WHERE anchor_id = :anchor_id")
+
+_DELETE_OWNED_ANCHOR = text(
+    "DELETE FROM anchors WHERE anchor_id = :anchor_id AND creator_id = :user_id"
+)
+
+# What unlock_anchor needs to explain a failed unlock, with the DB clock the
+# guarded UPDATE compared against, so the diagnosis can't disagree with it
+_SELECT_ANCHOR_FOR_UNLOCK_CHECK = text("""
+    SELECT anchor_id, creator_id, circle_id, visibility, status,
+           max_unlock, current_unlock, activation_time, expiration_time,
+           UTC_TIMESTAMP() AS db_now
+    FROM anchors
+    WHERE anchor_id = :anchor_id
+""")
+
+_SELECT_ACTIVATION_TIME = text("SELECT activation_time FROM anchors WHERE anchor_id = :anchor_id")
+
+_EXPIRE_EXHAUSTED_ANCHOR = text("""
+    UPDATE anchors
+    SET status = 'EXPIRED'
+    WHERE anchor_id = :anchor_id
+      AND status = 'ACTIVE'
+      AND max_unlock IS NOT NULL
+      AND current_unlock >= max_unlock
+""")
+
+_NEARBY_BBOX_PREDICATE = "MBRContains(ST_GeomFromText(:bbox, 4326), a.location)"
+
+
+def _nearby_candidates_cte(row_filters: str, use_bbox: bool) -> str:
+    """
+    Candidates for the nearby endpoints with the sphere distance computed once per row.
+    The bbox and every per-row filter (activation window, bans, blocks, view access
+    and the request's status/visibility/tag/content filters) sit inside the CTE on
+    the base table, so MBRContains (SPATIAL index), idx_anchors_status_visibility and
+    the idx_anchors_tags multi-valued index are all open to the optimizer before the
+    CTE is materialized. Queries select FROM nearby a with NO_MERGE(a) so distance_m
+    isn't recomputed wherever it is referenced. Searches whose box would cross a pole
+    or the antimeridian skip the bbox and rely on the distance check alone.
+    """
+    bbox_predicate = _NEARBY_BBOX_PREDICATE if use_bbox else "TRUE"
+    return f"""
+    WITH nearby AS (
+        SELECT
+            a.*,
+            ST_Distance_Sphere(a.location, ST_GeomFromText(:user_point, 4326)) AS distance_m
+        FROM anchors a
+        WHERE {bbox_predicate}
+        {row_filters}
+    )
+"""
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def _get_anchor_by_id(db: Session, anchor_id: str):
@@ -51,24 +173,7 @@ def _get_anchor_by_id(db: Session, anchor_id: str):
     Uses ST_X/ST_Y to extract longitude/latitude from the MySQL POINT geometry column.
     Returns None if no anchor is found.
     """
-    row = db.execute(
-        text("""
-            SELECT a.anchor_id, a.creator_id, a.circle_id, a.title, a.description,
-                   ST_X(a.location) AS longitude, ST_Y(a.location) AS latitude,
-                   a.altitude, a.status, a.visibility, a.unlock_radius,
-                   a.max_unlock, a.current_unlock, a.activation_time,
-                   a.expiration_time, a.tags, a.is_savable,
-                   (
-                       SELECT GROUP_CONCAT(DISTINCT c.content_type ORDER BY c.content_type SEPARATOR ',')
-                       FROM Content c
-                       WHERE c.anchor_id = a.anchor_id
-                   ) AS content_type
-            FROM anchors a
-            WHERE a.anchor_id = :anchor_id
-        """),
-        {"anchor_id": anchor_id},
-    ).fetchone()
-    return row
+    return db.execute(_SELECT_ANCHOR_BY_ID, {"anchor_id": anchor_id}).fetchone()
 
 
 def _get_circle_for_access(db: Session, circle_id: str, user_id: str):
@@ -191,10 +296,7 @@ def _require_anchor_view_access(db: Session, row, user_id: str):
 
 
 def _require_location_access(db: Session, user_id: str):
-    row = db.execute(
-        text("SELECT is_ghost_mode FROM users WHERE user_id = :user_id"),
-        {"user_id": user_id},
-    ).fetchone()
+    row = db.execute(_SELECT_GHOST_MODE, {"user_id": user_id}).fetchone()
     if row and row.is_ghost_mode:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -202,13 +304,64 @@ def _require_location_access(db: Session, user_id: str):
         )
 
 
+def _point_wkt(lat: float, lon: float) -> str:
+    """
+    WKT for a location, bound as a parameter wherever SQL parses a point.
+    Longitude comes first, matching how ST_X/ST_Y read locations back.
+    """
+    return f"POINT({lon} {lat})"
+
+
+def _nearby_bbox_wkt(lat: float, lon: float, radius_m: float) -> Optional[str]:
+    """
+    Build a WKT bounding box that fully contains the search circle.
+    MBRContains against this box can use the SPATIAL index on anchors.location, so the
+    exact ST_Distance_Sphere check only runs on the candidates inside the box.
+    Coordinates use the same "lon lat" order as the POINT values stored by create/update.
+    Returns None when the box would reach past a pole or wrap the antimeridian:
+    clamping there would either cut off part of the circle or hand SRID 4326 an
+    out-of-range coordinate, so callers search without the box instead.
+    """
+    lat_delta = radius_m / METERS_PER_DEGREE_LAT
+    min_lat = lat - lat_delta
+    max_lat = lat + lat_delta
+    if min_lat < -90.0 or max_lat > 90.0:
+        return None
+
+    # Longitude degrees shrink toward the poles — size the box using the
+    # poleward edge so the circle never spills outside it
+    cos_edge = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_edge < 1e-6:
+        return None
+    lon_delta = radius_m / (METERS_PER_DEGREE_LAT * cos_edge)
+    min_lon = lon - lon_delta
+    max_lon = lon + lon_delta
+    if min_lon < -180.0 or max_lon > 180.0:
+        return None
+
+    return (
+        f"POLYGON(({min_lon} {min_lat}, {max_lon} {min_lat}, {max_lon} {max_lat}, "
+        f"{min_lon} {max_lat}, {min_lon} {min_lat}))"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _decode_tags(raw_tags: str) -> Tuple[str, ...]:
+    """
+    Decode a stored tags JSON string once per distinct value.
+    Tag sets repeat heavily across anchors, so list endpoints mostly hit the cache.
+    Returns a tuple so the cached value can't be mutated by callers.
+    """
+    try:
+        parsed = orjson.loads(raw_tags)
+    except ValueError:
+        return ()
+    return tuple(parsed) if isinstance(parsed, list) else ()
+
+
 def _parse_tags(raw_tags) -> Optional[List[str]]:
     if isinstance(raw_tags, str):
-        try:
-            parsed = json.loads(raw_tags)
-            return parsed if isinstance(parsed, list) else []
-        except Exception:
-            return []
+        return list(_decode_tags(raw_tags))
     return raw_tags
 
 
@@ -225,7 +378,7 @@ def _parse_content_types(raw_content_type) -> Optional[List[str]]:
 
 def _normalize_enum_filter(
     values,
-    valid_values: set[str],
+    valid_values: frozenset[str],
     detail: str,
 ) -> Optional[List[str]]:
     if values is None:
@@ -290,18 +443,14 @@ def _normalize_stored_tags(tags: Optional[List[str]]) -> Optional[List[str]]:
     return _normalize_tag_filter(tags)
 
 
-def _add_in_clause(
-    field_sql: str,
-    values: List[str],
-    param_prefix: str,
-    params: Dict[str, object],
-) -> str:
-    placeholders: List[str] = []
+def _in_clause(field_sql: str, param_prefix: str, count: int) -> str:
+    placeholders = ", ".join(f":{param_prefix}_{idx}" for idx in range(count))
+    return f"{field_sql} IN ({placeholders})"
+
+
+def _add_in_params(values: List[str], param_prefix: str, params: Dict[str, object]):
     for idx, value in enumerate(values):
-        key = f"{param_prefix}_{idx}"
-        placeholders.append(f":{key}")
-        params[key] = value
-    return f"{field_sql} IN ({', '.join(placeholders)})"
+        params[f"{param_prefix}_{idx}"] = value
 
 
 def _creator_is_not_banned_clause(table_alias: str) -> str:
@@ -322,46 +471,30 @@ def _creator_is_not_blocked_clause(table_alias: str) -> str:
     )
 
 
-def _build_anchor_filters(
+@lru_cache(maxsize=256)
+def _anchor_filter_sql(
     table_alias: str,
-    visibility=None,
-    anchor_status=None,
-    content_type=None,
-    tags=None,
-) -> Tuple[str, Dict[str, object]]:
+    visibility_count: int,
+    status_count: int,
+    content_type_count: int,
+    has_tags: bool,
+) -> str:
+    """
+    SQL for the optional anchor filters, keyed only by how many values each one has
+    (tags bind as a single JSON array, so only their presence matters).
+    The values themselves are bound by _build_anchor_filters, so every request with
+    the same filter shape reuses one string (and one cached statement downstream).
+    """
     filters: List[str] = []
-    params: Dict[str, object] = {}
 
-    normalized_visibility = _normalize_visibility_filter(visibility)
-    if normalized_visibility:
-        filters.append(
-            _add_in_clause(
-                f"{table_alias}.visibility",
-                normalized_visibility,
-                "visibility",
-                params,
-            )
-        )
+    if visibility_count:
+        filters.append(_in_clause(f"{table_alias}.visibility", "visibility", visibility_count))
 
-    normalized_status = _normalize_status_filter(anchor_status)
-    if normalized_status:
-        filters.append(
-            _add_in_clause(
-                f"{table_alias}.status",
-                normalized_status,
-                "anchor_status",
-                params,
-            )
-        )
+    if status_count:
+        filters.append(_in_clause(f"{table_alias}.status", "anchor_status", status_count))
 
-    normalized_content_types = _normalize_content_type_filter(content_type)
-    if normalized_content_types:
-        in_clause = _add_in_clause(
-            "c.content_type",
-            normalized_content_types,
-            "content_type",
-            params,
-        )
+    if content_type_count:
+        in_clause = _in_clause("c.content_type", "content_type", content_type_count)
         filters.append(
             f"""
             EXISTS (
@@ -373,20 +506,213 @@ def _build_anchor_filters(
             """
         )
 
-    normalized_tags = _normalize_tag_filter(tags)
-    if normalized_tags:
-        tag_filters: List[str] = []
-        for idx, tag in enumerate(normalized_tags):
-            key = f"tag_{idx}"
-            params[key] = json.dumps(tag)
-            tag_filters.append(
-                f"JSON_CONTAINS(COALESCE({table_alias}.tags, JSON_ARRAY()), CAST(:{key} AS JSON), '$')"
-            )
-        filters.append(f"({' OR '.join(tag_filters)})")
+    if has_tags:
+        # Any-of match against the whole tag list in one bound JSON array;
+        # JSON_OVERLAPS can be served by the idx_anchors_tags multi-valued index
+        filters.append(f"JSON_OVERLAPS({table_alias}.tags, CAST(:tags AS JSON))")
 
     if not filters:
-        return "", params
-    return " AND " + " AND ".join(filters), params
+        return ""
+    return " AND " + " AND ".join(filters)
+
+
+def _build_anchor_filters(
+    table_alias: str,
+    visibility=None,
+    anchor_status=None,
+    content_type=None,
+    tags=None,
+) -> Tuple[str, Dict[str, object]]:
+    params: Dict[str, object] = {}
+
+    normalized_visibility = _normalize_visibility_filter(visibility) or []
+    _add_in_params(normalized_visibility, "visibility", params)
+
+    normalized_status = _normalize_status_filter(anchor_status) or []
+    _add_in_params(normalized_status, "anchor_status", params)
+
+    normalized_content_types = _normalize_content_type_filter(content_type) or []
+    _add_in_params(normalized_content_types, "content_type", params)
+
+    normalized_tags = _normalize_tag_filter(tags) or []
+    if normalized_tags:
+        params["tags"] = orjson.dumps(normalized_tags).decode()
+
+    filters = _anchor_filter_sql(
+        table_alias,
+        len(normalized_visibility),
+        len(normalized_status),
+        len(normalized_content_types),
+        bool(normalized_tags),
+    )
+    return filters, params
+
+
+@lru_cache(maxsize=256)
+def _update_anchor_statement(columns: Tuple[str, ...], set_location: bool):
+    """
+    UPDATE for a partial anchor edit, cached per set of changed columns.
+    columns are fixed names chosen by update_anchor, never user input; values
+    and the new location are bound, so each shape renders identical SQL.
+    """
+    assignments = [f"{column} = :{column}" for column in columns]
+    if set_location:
+        assignments.append("location = ST_GeomFromText(:point, 4326)")
+    return text(
+        f"UPDATE anchors SET {', '.join(assignments)} "
+        "WHERE anchor_id = :anchor_id AND creator_id = :user_id"
+    )
+
+
+# Nearby discovery only returns anchors active for the current time window.
+# Null activation_time means "active immediately";
+# null expiration_time means "no end time" (always active).
+_NEARBY_BASE_FILTERS = (
+    """
+        AND (a.activation_time IS NULL OR a.activation_time <= UTC_TIMESTAMP())
+        AND (a.expiration_time IS NULL OR a.expiration_time >= UTC_TIMESTAMP())
+    """
+    + _creator_is_not_banned_clause("a")
+    + _creator_is_not_blocked_clause("a")
+    + _viewer_can_access_anchor_clause("a")
+)
+
+
+# Unlock check-and-increment in one statement: view access, status, activation
+# window (against the DB clock) and max_unlock are all WHERE conditions, and the
+# final allowed unlock flips the anchor to EXPIRED. MySQL applies SET assignments
+# left to right, so status is computed from the pre-increment current_unlock.
+# LAST_INSERT_ID(expr) hands the new count back on the OK packet, standing in
+# for RETURNING.
+_UNLOCK_IF_AVAILABLE = text(f"""
+    UPDATE anchors
+    SET status = CASE
+            WHEN max_unlock IS NOT NULL AND current_unlock + 1 >= max_unlock THEN 'EXPIRED'
+            ELSE status
+        END,
+        current_unlock = LAST_INSERT_ID(current_unlock + 1)
+    WHERE anchor_id = :anchor_id
+      AND status = 'ACTIVE'
+      AND (max_unlock IS NULL OR current_unlock < max_unlock)
+      AND (activation_time IS NULL OR activation_time <= UTC_TIMESTAMP())
+      AND (expiration_time IS NULL OR expiration_time >= UTC_TIMESTAMP())
+      {_viewer_can_access_anchor_clause("anchors")}
+""")
+
+
+@lru_cache(maxsize=256)
+def _nearby_filter_options_statement(extra_filters: str, use_bbox: bool = True):
+    row_filters = _NEARBY_BASE_FILTERS + extra_filters
+    return text(f"""
+        {_nearby_candidates_cte(row_filters, use_bbox)}
+        SELECT /*+ NO_MERGE(a) */
+            a.status,
+            a.visibility,
+            a.tags,
+            (
+                SELECT GROUP_CONCAT(DISTINCT c.content_type ORDER BY c.content_type SEPARATOR ',')
+                FROM Content c
+                WHERE c.anchor_id = a.anchor_id
+            ) AS content_type
+        FROM nearby a
+        WHERE a.distance_m <= :radius_m
+    """)
+
+
+@lru_cache(maxsize=256)
+def _nearby_summary_statement(extra_filters: str, use_bbox: bool = True):
+    row_filters = _NEARBY_BASE_FILTERS + extra_filters
+    return text(f"""
+        {_nearby_candidates_cte(row_filters, use_bbox)}
+        SELECT /*+ NO_MERGE(a) */
+            a.anchor_id,
+            a.title,
+            ST_X(a.location) AS longitude,
+            ST_Y(a.location) AS latitude,
+            a.status,
+            a.distance_m
+        FROM nearby a
+        WHERE a.distance_m <= :radius_m
+        ORDER BY a.distance_m ASC, a.anchor_id DESC
+    """)
+
+
+# Rows strictly after the cursor in the /nearby sort order
+# (distance ascending then anchor_id descending, or anchor_id descending alone)
+_NEARBY_AFTER_CURSOR = """
+        AND (
+            CASE WHEN :sort_by = 'distance' THEN
+                a.distance_m > :cursor_distance
+                OR (a.distance_m = :cursor_distance AND a.anchor_id < :cursor_id)
+            ELSE a.anchor_id < :cursor_id
+            END
+        )
+"""
+
+
+@lru_cache(maxsize=256)
+def _nearby_anchors_statement(
+    extra_filters: str,
+    after_cursor: bool = False,
+    use_bbox: bool = True,
+):
+    """One prepared statement per filter shape; extra_filters comes from _anchor_filter_sql."""
+    row_filters = _NEARBY_BASE_FILTERS + extra_filters
+    # The cursor compares distance_m, so it applies to the materialized CTE
+    page_filter = _NEARBY_AFTER_CURSOR if after_cursor else ""
+    return text(f"""
+        {_nearby_candidates_cte(row_filters, use_bbox)}
+        SELECT /*+ NO_MERGE(a) */
+            a.anchor_id,
+            a.creator_id,
+            a.circle_id,
+            a.title,
+            a.description,
+            ST_X(a.location) AS longitude,
+            ST_Y(a.location) AS latitude,
+            a.altitude,
+            a.status,
+            a.visibility,
+            a.unlock_radius,
+            a.max_unlock,
+            a.current_unlock,
+            a.activation_time,
+            a.expiration_time,
+            a.tags,
+            a.is_savable,
+            (
+                SELECT GROUP_CONCAT(DISTINCT c.content_type ORDER BY c.content_type SEPARATOR ',')
+                FROM Content c
+                WHERE c.anchor_id = a.anchor_id
+            ) AS content_type,
+         COALESCE((
+SELECT SUM(CASE WHEN vote = 'UPVOTE' THEN 1 ELSE -1 END)
+FROM anchor_votes av
+WHERE av.anchor_id = a.anchor_id
+), 0) AS net_votes,
+(
+SELECT vote FROM anchor_votes av
+WHERE av.anchor_id = a.anchor_id AND av.user_id = :session_user_id
+LIMIT 1
+) AS user_vote,
+            -- Only unlocked if creator OR currently within radius
+            (a.creator_id = :session_user_id OR a.distance_m <= a.unlock_radius) AS is_unlocked,
+            -- Track if previously unlocked to handle count increments correctly
+            (ua.anchor_id IS NOT NULL) AS has_previously_unlocked,
+            -- Distance in meters from user's position, computed once in the CTE
+            a.distance_m
+        FROM nearby a
+        LEFT JOIN unlocked_anchors ua 
+            ON a.anchor_id = ua.anchor_id AND ua.user_id = :session_user_id
+        WHERE a.distance_m <= :radius_m
+        {page_filter}
+        ORDER BY
+            -- Default sort is by distance ascending; fallback sorts by anchor_id.
+            -- Bound rather than interpolated so both sorts render the same SQL.
+            CASE WHEN :sort_by = 'distance' THEN distance_m END ASC,
+            a.anchor_id DESC
+        LIMIT :limit
+    """)
 
 
 def _serialize_filter_counts(
@@ -439,17 +765,129 @@ def _row_to_response(row, net_votes: int = 0, user_vote: Optional[str] = None) -
     )
 
 
+def _nearby_cache_key(user_id: str, lat: float, lon: float, radius_km: float, *filters) -> tuple:
+    return (
+        user_id,
+        round(lat, NEARBY_CACHE_COORD_PRECISION),
+        round(lon, NEARBY_CACHE_COORD_PRECISION),
+        radius_km,
+        *(tuple(values) if isinstance(values, list) else values for values in filters),
+    )
+
+
+def _encode_nearby_cursor(row) -> str:
+    """Opaque keyset cursor: the (distance_m, anchor_id) of the last row on a page."""
+    raw = orjson.dumps([row.distance_m, row.anchor_id])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_nearby_cursor(cursor: str) -> Tuple[float, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        distance_m, anchor_id = orjson.loads(raw)
+        return float(distance_m), str(anchor_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _nearby_page_response(body: bytes, next_cursor: Optional[str]) -> Response:
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _invalidate_nearby_cache():
+    """Drop cached /nearby responses after any write that could change them."""
+    with _nearby_cache_lock:
+        _nearby_cache.clear()
+
+
+def invalidate_anchor_caches(anchor_id: Optional[str] = None):
+    """
+    For routers outside this module that write anchors, their content, or who
+    may see them (reports, admin, library, content, blocks, bans, circle
+    membership): call after commit so /nearby and the unlock gate stop serving
+    state from before the write. Pass the anchor_id when one anchor changed;
+    None evicts every unlock gate entry.
+    """
+    _invalidate_nearby_cache()
+    _forget_unlock_gate(anchor_id)
+
+
+def _get_unlock_gate(anchor_id: str):
+    if settings.UNLOCK_GATE_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _unlock_gate_cache_lock:
+        return _unlock_gate_cache.get(anchor_id)
+
+
+def _remember_unlock_gate(row, anchor_status: Optional[str] = None):
+    """Cache an anchor that can't be unlocked because of its status; anchor_status overrides row.status."""
+    anchor_status = anchor_status or row.status
+    if settings.UNLOCK_GATE_CACHE_TTL_SECONDS <= 0 or anchor_status == "ACTIVE":
+        return
+    gate = SimpleNamespace(
+        creator_id=row.creator_id,
+        visibility=row.visibility,
+        status=anchor_status,
+    )
+    with _unlock_gate_cache_lock:
+        _unlock_gate_cache[row.anchor_id] = gate
+
+
+def _forget_unlock_gate(anchor_id: Optional[str] = None):
+    """Evict one anchor's gate entry, or all of them when anchor_id is None."""
+    with _unlock_gate_cache_lock:
+        if anchor_id is None:
+            _unlock_gate_cache.clear()
+        else:
+            _unlock_gate_cache.pop(anchor_id, None)
+
+
+def _require_active_status(row):
+    # Anchor must be in ACTIVE status to be unlocked
+    if row.status != "ACTIVE":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Anchor is not active (status: {row.status})",
+        )
+
+
+def _require_unlock_window(row, now: datetime):
+    """Raise 403 unless the anchor is ACTIVE and now falls inside its activation window."""
+    _require_active_status(row)
+
+    # If activation_time is set, block unlocking before that time
+    if row.activation_time and now < row.activation_time:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Anchor is not yet active. Opens at {row.activation_time} UTC",
+        )
+
+    # If expiration_time is set and we're past it, block — the expire_anchors
+    # event (tasks.sql) flips the status, so this read path stays write-free
+    if row.expiration_time and now > row.expiration_time:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Anchor has expired",
+        )
+
+
 def _to_utc_naive(dt: Optional[datetime]) -> Optional[datetime]:
     """
     Normalize incoming datetimes so anchor creation can keep using naive UTC comparisons.
     - Aware datetime: convert to UTC, then strip tzinfo.
     - Naive datetime: keep as-is.
+    Fractional seconds are dropped to match the DATETIME column, so responses built
+    from these values agree with what is stored.
     """
     if dt is None:
         return None
-    if dt.tzinfo is None:
-        return dt
-    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.replace(microsecond=0)
 
 
 # ── Create Anchor ─────────────────────────────────────────────────────────────
@@ -467,11 +905,6 @@ def create_anchor(
     Location is stored as a MySQL POINT geometry using ST_GeomFromText with SRID 4326 (WGS84).
     Tags are serialized to JSON for storage.
     """
-    if payload.visibility not in VALID_VISIBILITY:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="visibility must be PUBLIC, PRIVATE, or CIRCLE_ONLY",
-        )
     _require_location_access(db, user_id)
     circle_id = _resolve_circle_id_for_create(db, payload, user_id)
 
@@ -490,12 +923,11 @@ def create_anchor(
             detail="expiration_time must be after activation_time",
         )
 
-    anchor_id = str(uuid.uuid4())
+    # Time-ordered so new rows append to the right edge of the primary key index
+    anchor_id = str(uuid7())
     # Serialize tags list to JSON string for DB storage, or None if no tags provided
     normalized_tags = _normalize_stored_tags(payload.tags)
-    tags_json = json.dumps(normalized_tags) if normalized_tags else None
-
-    activation_time = activation_time if activation_time is not None else datetime.utcnow()
+    tags_json = orjson.dumps(normalized_tags).decode() if normalized_tags else None
 
     db.execute(
         text("""
@@ -507,7 +939,7 @@ def create_anchor(
                 (:anchor_id, :creator_id, :circle_id, :title, :description,
                  ST_GeomFromText(:point, 4326), :altitude,
                  'ACTIVE', :visibility, :unlock_radius, :max_unlock,
-                 :activation_time, :expiration_time, :tags, :is_savable)
+                 COALESCE(:activation_time, UTC_TIMESTAMP()), :expiration_time, :tags, :is_savable)
         """),
         {
             "anchor_id": anchor_id,
@@ -516,7 +948,7 @@ def create_anchor(
             "title": payload.title,
             "description": payload.description,
             # MySQL POINT format is POINT(longitude latitude) — note lon comes first
-            "point": f"POINT({payload.longitude} {payload.latitude})",
+            "point": _point_wkt(payload.latitude, payload.longitude),
             "altitude": payload.altitude,
             "visibility": payload.visibility,
             "unlock_radius": payload.unlock_radius,
@@ -527,12 +959,36 @@ def create_anchor(
             "is_savable": payload.is_savable,
         },
     )
+    if activation_time is None:
+        # Defaulted by the DB clock the unlock guard compares against; read it back
+        activation_time = db.execute(_SELECT_ACTIVATION_TIME, {"anchor_id": anchor_id}).scalar()
     db.commit()
+    _invalidate_nearby_cache()
 
-    # Re-fetch the inserted row to return the full response with all fields
-    row = _get_anchor_by_id(db, anchor_id)
     log_action(db, user_id, "ANCHOR_CREATE", target_id=anchor_id, target_type="ANCHOR", request=request)
-    return _row_to_response(row)
+
+    # Every other column was just written from these values, so build the response
+    # directly instead of re-reading the whole row
+    return AnchorResponse(
+        anchor_id=anchor_id,
+        creator_id=user_id,
+        circle_id=circle_id,
+        title=payload.title,
+        description=payload.description,
+        latitude=payload.latitude,
+        longitude=payload.longitude,
+        altitude=payload.altitude,
+        status="ACTIVE",
+        visibility=payload.visibility,
+        unlock_radius=payload.unlock_radius,
+        max_unlock=payload.max_unlock,
+        current_unlock=0,
+        activation_time=activation_time,
+        expiration_time=expiration_time,
+        always_active=expiration_time is None,
+        tags=normalized_tags,
+        is_savable=payload.is_savable,
+    )
 
 
 # ── Update Anchor ─────────────────────────────────────────────────────────────
@@ -566,15 +1022,13 @@ def update_anchor(
     if payload.latitude is not None or payload.longitude is not None:
         _require_location_access(db, user_id)
 
-    if payload.visibility is not None and payload.visibility not in VALID_VISIBILITY:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="visibility must be PUBLIC, PRIVATE, or CIRCLE_ONLY",
-        )
     target_circle_id = _resolve_circle_id_for_update(db, payload, row, user_id)
 
+    activation_time = _to_utc_naive(payload.activation_time)
+    expiration_time = _to_utc_naive(payload.expiration_time)
+
     now = datetime.utcnow()
-    if payload.expiration_time is not None and payload.expiration_time < now:
+    if expiration_time is not None and expiration_time < now:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="expiration_time cannot be in the past",
@@ -584,14 +1038,14 @@ def update_anchor(
     # using the incoming payload value if provided, otherwise falling back to the
     # existing DB value. This is needed to validate the window before writing anything.
     effective_activation = (
-        payload.activation_time if payload.activation_time is not None else row.activation_time
+        activation_time if activation_time is not None else row.activation_time
     )
     # If always_active is being set to True, clear expiration regardless of what was sent.
     # Otherwise use the new expiration_time if provided, or keep the existing one.
     if payload.always_active is True:
         effective_expiration = None
-    elif payload.expiration_time is not None:
-        effective_expiration = payload.expiration_time
+    elif expiration_time is not None:
+        effective_expiration = expiration_time
     else:
         effective_expiration = row.expiration_time
 
@@ -619,43 +1073,50 @@ def update_anchor(
         fields["max_unlock"] = payload.max_unlock
     if payload.altitude is not None:
         fields["altitude"] = payload.altitude
-    if payload.activation_time is not None:
-        fields["activation_time"] = payload.activation_time
+    if activation_time is not None:
+        fields["activation_time"] = activation_time
     # always_active=True explicitly clears expiration_time in the DB
     if payload.always_active is True:
         fields["expiration_time"] = None
-    elif payload.expiration_time is not None:
-        fields["expiration_time"] = payload.expiration_time
+    elif expiration_time is not None:
+        fields["expiration_time"] = expiration_time
     if payload.tags is not None:
         normalized_tags = _normalize_stored_tags(payload.tags)
-        fields["tags"] = json.dumps(normalized_tags) if normalized_tags else None
+        fields["tags"] = orjson.dumps(normalized_tags).decode() if normalized_tags else None
     if payload.is_savable is not None:
         fields["is_savable"] = payload.is_savable
 
     # Handle partial location update — if only lat or only lon is provided,
     # fall back to the existing value for the other coordinate
-    location_update = ""
-    if payload.latitude is not None or payload.longitude is not None:
+    set_location = payload.latitude is not None or payload.longitude is not None
+    new_lat, new_lon = row.latitude, row.longitude
+    if set_location:
         new_lat = payload.latitude if payload.latitude is not None else row.latitude
         new_lon = payload.longitude if payload.longitude is not None else row.longitude
-        location_update = f", location = ST_GeomFromText('POINT({new_lon} {new_lat})', 4326)"
 
-    if fields or location_update:
-        set_clause = ", ".join(f"{k} = :{k}" for k in fields)
-        if set_clause and location_update:
-            set_clause += location_update
-        elif location_update:
-            set_clause = location_update.lstrip(", ")
+    if fields or set_location:
+        params = {**fields, "anchor_id": anchor_id, "user_id": user_id}
+        if set_location:
+            params["point"] = _point_wkt(new_lat, new_lon)
 
-        fields["anchor_id"] = anchor_id
-        db.execute(
-            text(f"UPDATE anchors SET {set_clause} WHERE anchor_id = :anchor_id"),
-            fields,
-        )
+        # Repeat the ownership check in the UPDATE so a concurrent delete or
+        # ownership change between the read above and this write is caught
+        result = db.execute(_update_anchor_statement(tuple(fields), set_location), params)
+        if result.rowcount == 0:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Anchor not found",
+            )
         db.commit()
+        _invalidate_nearby_cache()
+        _forget_unlock_gate(anchor_id)
 
-    updated = _get_anchor_by_id(db, anchor_id)
     log_action(db, user_id, "ANCHOR_EDIT", target_id=anchor_id, target_type="ANCHOR", request=request)
+
+    # Overlay the written fields on the row read for the ownership check rather
+    # than re-reading the anchor after the commit
+    updated = SimpleNamespace(**{**row._mapping, **fields, "latitude": new_lat, "longitude": new_lon})
     return _row_to_response(updated)
 
 
@@ -671,25 +1132,24 @@ def delete_anchor(
     """
     Delete an Anchor. Only the creator can delete.
     Returns a success message on deletion.
+    The ownership check is part of the DELETE itself, so the happy path is one
+    statement and there is no gap between checking and deleting.
     """
-    row = _get_anchor_by_id(db, anchor_id)
-    if not row:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Anchor not found",
-        )
-    # Ensure only the creator can delete this anchor
-    if row.creator_id != user_id:
+    result = db.execute(_DELETE_OWNED_ANCHOR, {"anchor_id": anchor_id, "user_id": user_id})
+    if result.rowcount == 0:
+        # Nothing deleted — only now look up whether the anchor exists at all
+        if db.execute(_ANCHOR_EXISTS, {"anchor_id": anchor_id}).fetchone() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Anchor not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to delete this Anchor",
         )
-
-    db.execute(
-        text("DELETE FROM anchors WHERE anchor_id = :anchor_id"),
-        {"anchor_id": anchor_id},
-    )
     db.commit()
+    _invalidate_nearby_cache()
+    _forget_unlock_gate(anchor_id)
     log_action(db, user_id, "ANCHOR_DELETE", target_id=anchor_id, target_type="ANCHOR", request=request)
     return {"message": "Anchor deleted successfully"}
 
@@ -709,79 +1169,63 @@ def unlock_anchor(
       1. Anchor exists
       2. Anchor status is ACTIVE
       3. Current time is after activation_time (if set)
-      4. Current time is before expiration_time (if set) — auto-expires if past
+      4. Current time is before expiration_time (if set)
       5. Unlock count has not exceeded max_unlock — auto-expires if reached
     On success, increments current_unlock counter.
+    All checks run inside a single conditional UPDATE using the database clock;
+    the row is only read when that UPDATE matches nothing, to pick the error —
+    again against the database clock. If the re-read row passes every check, the
+    anchor changed in between and the UPDATE is retried once.
+    When the unlock gate cache is enabled, attempts on hot anchors that are not
+    ACTIVE are rejected from it without touching the database, as long as the
+    caller could view the anchor without a circle lookup.
     """
-    row = _get_anchor_by_id(db, anchor_id)
-    if not row:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Anchor not found",
-        )
-    _require_anchor_view_access(db, row, user_id)
-
-    # Anchor must be in ACTIVE status to be unlocked
-    if row.status != "ACTIVE":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Anchor is not active (status: {row.status})",
-        )
-
-    now = datetime.utcnow()
-
-    # If activation_time is set, block unlocking before that time
-    if row.activation_time and now < row.activation_time:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Anchor is not yet active. Opens at {row.activation_time} UTC",
-        )
-
-    # If expiration_time is set and we're past it, auto-mark as EXPIRED and block
-    if row.expiration_time and now > row.expiration_time:
-        db.execute(
-            text("UPDATE anchors SET status = 'EXPIRED' WHERE anchor_id = :anchor_id"),
-            {"anchor_id": anchor_id},
-        )
-        db.commit()
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Anchor has expired",
-        )
-
-    # If max_unlock is set and already reached, auto-mark as EXPIRED and block
-    if row.max_unlock is not None and row.current_unlock >= row.max_unlock:
-        db.execute(
-            text("UPDATE anchors SET status = 'EXPIRED' WHERE anchor_id = :anchor_id"),
-            {"anchor_id": anchor_id},
-        )
-        db.commit()
+    gate = _get_unlock_gate(anchor_id)
+    if gate is not None and (gate.visibility == "PUBLIC" or gate.creator_id == user_id):
+        _require_active_status(gate)
+
+    params = {"anchor_id": anchor_id, "session_user_id": user_id}
+    for _attempt in range(UNLOCK_ATTEMPTS):
+        # Happy path is this one statement — no read of the anchor beforehand
+        result = db.execute(_UNLOCK_IF_AVAILABLE, params)
+        if result.rowcount:
+            break
+        db.rollback()
+
+        # Nothing updated — read the row only to report why, in the documented order
+        row = db.execute(_SELECT_ANCHOR_FOR_UNLOCK_CHECK, {"anchor_id": anchor_id}).fetchone()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Anchor not found",
+            )
+        _require_anchor_view_access(db, row, user_id)
+        _remember_unlock_gate(row)
+        _require_unlock_window(row, row.db_now)
+        if row.max_unlock is not None and row.current_unlock >= row.max_unlock:
+            # Expire anchors that reached the cap before it was enforced in the UPDATE itself.
+            # The gate only learns EXPIRED when this statement is what set it; if the
+            # row changed some other way, drop any entry and let the next attempt re-read.
+            expired = db.execute(_EXPIRE_EXHAUSTED_ANCHOR, {"anchor_id": anchor_id}).rowcount
+            db.commit()
+            if expired:
+                _remember_unlock_gate(row, anchor_status="EXPIRED")
+            else:
+                _forget_unlock_gate(anchor_id)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Anchor has reached its maximum number of unlocks",
+            )
+    else:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Anchor has reached its maximum number of unlocks",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Anchor changed during unlock, please try again",
         )
-
-    # All checks passed — increment the unlock counter
-    db.execute(
-        text("""
-            UPDATE anchors
-            SET current_unlock = current_unlock + 1
-            WHERE anchor_id = :anchor_id
-        """),
-        {"anchor_id": anchor_id},
-    )
     db.commit()
 
-    new_count = row.current_unlock + 1
-
-    # If this was the final allowed unlock, mark anchor as EXPIRED
-    if row.max_unlock is not None and new_count >= row.max_unlock:
-        db.execute(
-            text("UPDATE anchors SET status = 'EXPIRED' WHERE anchor_id = :anchor_id"),
-            {"anchor_id": anchor_id},
-        )
-        db.commit()
+    new_count = result.lastrowid
 
+    _invalidate_nearby_cache()
     log_action(db, user_id, "ANCHOR_UNLOCK", target_id=anchor_id, target_type="ANCHOR", request=request)
 
     return {
@@ -862,7 +1306,7 @@ def get_all_anchors(
 def get_nearby_anchor_filter_options(
     lat: float = Query(..., description="User's current latitude"),
     lon: float = Query(..., description="User's current longitude"),
-    radius_km: float = Query(5.0, description="Search radius in kilometers"),
+    radius_km: float = Query(5.0, gt=0, le=NEARBY_MAX_RADIUS_KM, description="Search radius in kilometers"),
     visibility: Optional[List[str]] = Query(None, description="Filter by visibility: PUBLIC, PRIVATE, CIRCLE_ONLY"),
     anchor_status: Optional[List[str]] = Query(None, alias="anchor_status", description="Filter by status: ACTIVE, EXPIRED, LOCKED, FLAGGED"),
     content_type: Optional[List[str]] = Query(None, description="Filter by content type: TEXT, FILE, LINK"),
@@ -878,16 +1322,10 @@ def get_nearby_anchor_filter_options(
 
     params = {
         "radius_m": radius_km * 1000,
-        "user_point": f"POINT({lon} {lat})",
+        "user_point": _point_wkt(lat, lon),
+        "bbox": _nearby_bbox_wkt(lat, lon, radius_km * 1000),
         "session_user_id": user_id,
     }
-    filters = """
-        AND (a.activation_time IS NULL OR a.activation_time <= UTC_TIMESTAMP())
-        AND (a.expiration_time IS NULL OR a.expiration_time >= UTC_TIMESTAMP())
-    """
-    filters += _creator_is_not_banned_clause("a")
-    filters += _creator_is_not_blocked_clause("a")
-    filters += _viewer_can_access_anchor_clause("a")
     extra_filters, extra_params = _build_anchor_filters(
         table_alias="a",
         visibility=visibility,
@@ -895,27 +1333,10 @@ def get_nearby_anchor_filter_options(
         content_type=content_type,
         tags=tags,
     )
-    filters += extra_filters
     params.update(extra_params)
 
     rows = db.execute(
-        text(f"""
-            SELECT
-                a.status,
-                a.visibility,
-                a.tags,
-                (
-                    SELECT GROUP_CONCAT(DISTINCT c.content_type ORDER BY c.content_type SEPARATOR ',')
-                    FROM Content c
-                    WHERE c.anchor_id = a.anchor_id
-                ) AS content_type
-            FROM anchors a
-            WHERE ST_Distance_Sphere(
-                a.location,
-                ST_GeomFromText(:user_point, 4326)
-            ) <= :radius_m
-            {filters}
-        """),
+        _nearby_filter_options_statement(extra_filters, use_bbox=params["bbox"] is not None),
         params,
     ).fetchall()
 
@@ -951,53 +1372,120 @@ def get_nearby_anchor_filter_options(
     )
 
 
+@router.get("/nearby/summary", response_model=List[AnchorListItem])
+def get_nearby_anchor_summaries(
+    lat: float = Query(..., description="User's current latitude"),
+    lon: float = Query(..., description="User's current longitude"),
+    radius_km: float = Query(5.0, gt=0, le=NEARBY_MAX_RADIUS_KM, description="Search radius in kilometers"),
+    visibility: Optional[List[str]] = Query(None, description="Filter by visibility: PUBLIC, PRIVATE, CIRCLE_ONLY"),
+    anchor_status: Optional[List[str]] = Query(None, alias="anchor_status", description="Filter by status: ACTIVE, EXPIRED, LOCKED, FLAGGED"),
+    content_type: Optional[List[str]] = Query(None, description="Filter by content type: TEXT, FILE, LINK"),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags; matches any selected tag"),
+    user_id: str = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """
+    Lean variant of /nearby for map markers and list rows, sorted by distance.
+    Projects only id, title, position, status and distance — no description,
+    tags, votes or content types — and does not auto-unlock anything.
+    """
+    _require_location_access(db, user_id)
+
+    if not anchor_status:
+        anchor_status = ["ACTIVE"]
+
+    params = {
+        "radius_m": radius_km * 1000,
+        "user_point": _point_wkt(lat, lon),
+        "bbox": _nearby_bbox_wkt(lat, lon, radius_km * 1000),
+        "session_user_id": user_id,
+    }
+    extra_filters, extra_params = _build_anchor_filters(
+        table_alias="a",
+        visibility=visibility,
+        anchor_status=anchor_status,
+        content_type=content_type,
+        tags=tags,
+    )
+    params.update(extra_params)
+
+    rows = db.execute(
+        _nearby_summary_statement(extra_filters, use_bbox=params["bbox"] is not None),
+        params,
+    ).fetchall()
+    items = [
+        AnchorListItem(
+            anchor_id=row.anchor_id,
+            title=row.title,
+            latitude=row.latitude,
+            longitude=row.longitude,
+            distance_m=row.distance_m,
+            status=row.status,
+        )
+        for row in rows
+    ]
+    return Response(content=ANCHOR_LIST_ITEM_ADAPTER.dump_json(items), media_type="application/json")
+
+
 @router.get("/nearby", response_model=List[AnchorResponse])
 def get_nearby_anchors(
     lat: float = Query(..., description="User's current latitude"),
     lon: float = Query(..., description="User's current longitude"),
-    radius_km: float = Query(5.0, description="Search radius in kilometers"),
+    radius_km: float = Query(5.0, gt=0, le=NEARBY_MAX_RADIUS_KM, description="Search radius in kilometers"),
     visibility: Optional[List[str]] = Query(None, description="Filter by visibility: PUBLIC, PRIVATE, CIRCLE_ONLY"),
     # Named anchor_status (not status) to avoid shadowing fastapi.status module
     anchor_status: Optional[List[str]] = Query(None, alias="anchor_status", description="Filter by status: ACTIVE, EXPIRED, LOCKED, FLAGGED"),
     content_type: Optional[List[str]] = Query(None, description="Filter by content type: TEXT, FILE, LINK"),
     tags: Optional[List[str]] = Query(None, description="Filter by tags; matches any selected tag"),
     sort_by: str = Query("distance", description="Sort by: distance or created_at"),
+    limit: int = Query(NEARBY_DEFAULT_PAGE_SIZE, ge=1, le=NEARBY_MAX_PAGE_SIZE, description="Maximum anchors per page"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     """
     US12 #3 — Get nearby anchors sorted by distance with optional filters.
-    Uses MySQL ST_Distance_Sphere for accurate great-circle distance in meters.
+    Uses MySQL ST_Distance_Sphere for accurate great-circle distance in meters,
+    after an MBRContains bounding-box prefilter that is served by the SPATIAL index.
     Filters are appended dynamically to the WHERE clause only if provided.
+    Results are paged by keyset: when more anchors remain, the response carries an
+    X-Next-Cursor header to pass back as ?cursor= for the next page.
     """
     _require_location_access(db, user_id)
 
-    # Mark passed anchors as EXPIRED before retrieving
-    db.execute(
-        text("UPDATE anchors SET status = 'EXPIRED' WHERE status = 'ACTIVE' AND expiration_time <= :now"),
-        {"now": datetime.utcnow()}
-    )
-    db.commit()
+    # Discovery defaults to ACTIVE anchors so the status/visibility index stays selective.
+    # Time-based expiry is flipped by the expire_anchors event (tasks.sql); the window
+    # filter below already hides past-due rows until that runs.
+    if not anchor_status:
+        anchor_status = ["ACTIVE"]
+
+    cache_key = None
+    if settings.NEARBY_CACHE_TTL_SECONDS > 0:
+        cache_key = _nearby_cache_key(
+            user_id, lat, lon, radius_km, visibility, anchor_status, content_type, tags, sort_by,
+            limit, cursor,
+        )
+        with _nearby_cache_lock:
+            cached = _nearby_cache.get(cache_key)
+        if cached is not None:
+            # Already-serialized JSON — skips the query, Pydantic and the JSON encoder
+            body, next_cursor = cached
+            return _nearby_page_response(body, next_cursor)
 
-    # Start with base params; filters string is built up conditionally below
-    filters = ""
     params = {
         "lat": lat,
         "lon": lon,
         "radius_m": radius_km * 1000,  # Convert km to meters for ST_Distance_Sphere
+        "user_point": _point_wkt(lat, lon),
+        # Index-assisted prefilter so only bbox candidates pay for the sphere distance
+        "bbox": _nearby_bbox_wkt(lat, lon, radius_km * 1000),
         "session_user_id": user_id,
+        "sort_by": sort_by,
+        # One extra row tells us whether another page exists
+        "limit": limit + 1,
     }
-
-    # Always return only anchors active for the current time window.
-    # Null activation_time means "active immediately";
-    # null expiration_time means "no end time" (always active).
-    filters += """
-        AND (a.activation_time IS NULL OR a.activation_time <= UTC_TIMESTAMP())
-        AND (a.expiration_time IS NULL OR a.expiration_time >= UTC_TIMESTAMP())
-    """
-    filters += _creator_is_not_banned_clause("a")
-    filters += _creator_is_not_blocked_clause("a")
-    filters += _viewer_can_access_anchor_clause("a")
+    if cursor:
+        params["cursor_distance"], params["cursor_id"] = _decode_nearby_cursor(cursor)
 
     extra_filters, extra_params = _build_anchor_filters(
         table_alias="a",
@@ -1006,70 +1494,24 @@ def get_nearby_anchors(
         content_type=content_type,
         tags=tags,
     )
-    filters += extra_filters
     params.update(extra_params)
 
-    # Default sort is by distance ascending; fallback sorts by anchor_id (insertion order)
-    order_clause = "distance_m ASC" if sort_by == "distance" else "a.anchor_id DESC"
-
     rows = db.execute(
-        text(f"""
-            SELECT
-                a.anchor_id,
-                a.creator_id,
-                a.circle_id,
-                a.title,
-                a.description,
-                ST_X(a.location) AS longitude,
-                ST_Y(a.location) AS latitude,
-                a.altitude,
-                a.status,
-                a.visibility,
-                a.unlock_radius,
-                a.max_unlock,
-                a.current_unlock,
-                a.activation_time,
-                a.expiration_time,
-                a.tags,
-                a.is_savable,
-                (
-                    SELECT GROUP_CONCAT(DISTINCT c.content_type ORDER BY c.content_type SEPARATOR ',')
-                    FROM Content c
-                    WHERE c.anchor_id = a.anchor_id
-                ) AS content_type,
-             COALESCE((
-    SELECT SUM(CASE WHEN vote = 'UPVOTE' THEN 1 ELSE -1 END)
-    FROM anchor_votes av
-    WHERE av.anchor_id = a.anchor_id
-), 0) AS net_votes,
-(
-    SELECT vote FROM anchor_votes av
-    WHERE av.anchor_id = a.anchor_id AND av.user_id = :session_user_id
-    LIMIT 1
-) AS user_vote,
-                -- Only unlocked if creator OR currently within radius
-                (a.creator_id = :session_user_id OR ST_Distance_Sphere(a.location, ST_GeomFromText(:user_point, 4326)) <= a.unlock_radius) AS is_unlocked,
-                -- Track if previously unlocked to handle count increments correctly
-                (ua.anchor_id IS NOT NULL) AS has_previously_unlocked,
-                -- Calculate distance in meters from user's position to each anchor
-                ST_Distance_Sphere(
-                    a.location,
-                    ST_GeomFromText(:user_point, 4326)
-                ) AS distance_m
-            FROM anchors a
-            LEFT JOIN unlocked_anchors ua 
-                ON a.anchor_id = ua.anchor_id AND ua.user_id = :session_user_id
-            WHERE ST_Distance_Sphere(
-                a.location,
-                ST_GeomFromText(:user_point, 4326)
-            ) <= :radius_m
-            {filters}
-            ORDER BY {order_clause}
-        """),
-        {**params, "user_point": f"POINT({lon} {lat})"},
+        _nearby_anchors_statement(
+            extra_filters,
+            after_cursor=bool(cursor),
+            use_bbox=params["bbox"] is not None,
+        ),
+        params,
     ).fetchall()
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_nearby_cursor(rows[-1])
+
     results = []
+    auto_unlocked = False
     for row in rows:
         is_unlocked = bool(row.is_unlocked)
         is_creator = row.creator_id == user_id
@@ -1097,6 +1539,7 @@ def get_nearby_anchors(
                     )
                 
                 db.commit()
+                auto_unlocked = True
                 is_unlocked = True
                 
                 # We artificially increment the count in the response so the UI is up to date immediately
@@ -1122,7 +1565,15 @@ def get_nearby_anchors(
                 
         results.append(_row_to_response(row))
 
-    return results
+    # Auto-unlocks changed unlock counts (and maybe status) other cached pages show
+    if auto_unlocked:
+        _invalidate_nearby_cache()
+
+    body = ANCHOR_LIST_ADAPTER.dump_json(results)
+    if cache_key is not None:
+        with _nearby_cache_lock:
+            _nearby_cache[cache_key] = (body, next_cursor)
+    return _nearby_page_response(body, next_cursor)
 
 # ── Vote on Anchor (US9) ──────────────────────────────────────────────────────
 
@@ -1196,6 +1647,7 @@ def vote_anchor(
         user_vote = payload.vote
 
     db.commit()
+    _invalidate_nearby_cache()
 
     net_votes = db.execute(
         text("""
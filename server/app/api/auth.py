@@ -13,32 +13,39 @@ Endpoints:
     POST /auth/password-reset/confirm — reset password using valid token
 """
 
+import hashlib
 import uuid
 import secrets
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from types import SimpleNamespace
+from typing import Optional
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from cachetools import TLRUCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.core.audit import log_action
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.core.dependencies import (
     ACCOUNT_DISABLED_DETAIL,
     ensure_user_is_active,
-    get_current_user_id,
+    get_current_user,
 )
 from app.core.email import send_email
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
-    hash_password,
-    verify_password,
+    password_needs_rehash,
+    submit_hash_password,
+    submit_verify_password,
 )
 from app.schemas.auth import (
     LoginRequest,
@@ -60,25 +67,101 @@ from app.schemas.auth import (
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 logger = logging.getLogger(__name__)
 
+GOOGLE_OAUTH_TIMEOUT_SECONDS = 5.0
+USERNAME_MAX_LENGTH = 50  # users.username is VARCHAR(50)
+OAUTH_USERNAME_ATTEMPTS = 3
+OAUTH_USERNAME_SUFFIX_BYTES = 3
+GOOGLE_TOKENINFO_CACHE_SECONDS = 300
+GOOGLE_TOKENINFO_CACHE_MAX_ENTRIES = 10000
+
+
+# ── SQL ───────────────────────────────────────────────────────────────────────
+# Every auth statement is a module-level TextClause, so login and refresh reuse
+# the same compiled object instead of constructing one per call.
+
+_SELECT_USER_BY_EMAIL = text("""
+    SELECT user_id, email, username, password_hash, is_banned
+    FROM users
+    WHERE email = :email
+""")
+
+_INSERT_SESSION = text("""
+    INSERT INTO user_sessions (session_id, user_id, token_hash, expires_at)
+    VALUES (:session_id, :user_id, :token_hash, UTC_TIMESTAMP() + INTERVAL :expire_days DAY)
+""")
+
+_REVOKE_SESSION = text("""
+    UPDATE user_sessions
+    SET revoked_at = UTC_TIMESTAMP()
+    WHERE token_hash = :token_hash
+""")
+
+_SELECT_VALID_SESSION = text("""
+    SELECT session_id FROM user_sessions
+    WHERE token_hash = :token_hash
+    AND revoked_at IS NULL
+    AND expires_at > UTC_TIMESTAMP()
+""")
+
+_STAMP_LAST_LOGIN = text("UPDATE users SET last_login = UTC_TIMESTAMP() WHERE user_id = :user_id")
+
+_REVOKE_ALL_USER_SESSIONS = text("""
+    UPDATE user_sessions
+    SET revoked_at = UTC_TIMESTAMP()
+    WHERE user_id = :user_id AND revoked_at IS NULL
+""")
+
+_EMAIL_EXISTS = text("SELECT 1 FROM users WHERE email = :email")
+
+_INSERT_PASSWORD_USER = text("""
+    INSERT INTO users (user_id, email, password_hash, username, last_login)
+    VALUES (:user_id, :email, :password_hash, :username, UTC_TIMESTAMP())
+""")
+
+_UPDATE_PASSWORD_HASH = text("UPDATE users SET password_hash = :password_hash WHERE user_id = :user_id")
+
+_INSERT_OAUTH_USER = text("""
+    INSERT INTO users (user_id, email, username, oauth_provider, oauth_provider_id)
+    VALUES (:user_id, :email, :username, :provider, :provider_id)
+""")
+
+_SET_RESET_TOKEN = text("""
+    UPDATE users
+    SET reset_token = :reset_token,
+        reset_token_expiry = UTC_TIMESTAMP() + INTERVAL :expire_minutes MINUTE
+    WHERE user_id = :user_id
+""")
+
+_SELECT_USER_BY_RESET_TOKEN = text("""
+    SELECT user_id FROM users
+    WHERE reset_token = :token_hash
+    AND reset_token_expiry IS NOT NULL
+    AND reset_token_expiry > UTC_TIMESTAMP()
+""")
+
+_RESET_PASSWORD = text("""
+    UPDATE users
+    SET password_hash = :password_hash,
+        reset_token = NULL,
+        reset_token_expiry = NULL
+    WHERE user_id = :user_id
+""")
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def _get_user_by_email(db: Session, email: str):
-    """Look up a user row by email address. Returns None if not found."""
-    result = db.execute(
-        text("SELECT * FROM users WHERE email = :email"),
-        {"email": email},
-    ).fetchone()
+    """
+    Look up a user row by email address. Returns None if not found.
+    Selects only the columns the auth flows read (not bio, avatar or reset fields).
+    """
+    result = db.execute(_SELECT_USER_BY_EMAIL, {"email": email}).fetchone()
     return result
 
 
-def _get_user_by_id(db: Session, user_id: str):
-    """Look up a user row by user_id (UUID). Returns None if not found."""
-    result = db.execute(
-        text("SELECT * FROM users WHERE user_id = :user_id"),
-        {"user_id": user_id},
-    ).fetchone()
-    return result
+def _hash_session_token(refresh_token: str) -> bytes:
+    """Sessions are keyed by the 32-byte SHA-256 of the refresh token, not the JWT itself."""
+    return hashlib.sha256(refresh_token.encode("utf-8")).digest()
 
 
 def _create_session(db: Session, user_id: str, refresh_token: str):
@@ -86,38 +169,27 @@ def _create_session(db: Session, user_id: str, refresh_token: str):
     Store a new refresh token session in user_sessions.
     Session expiry is set based on REFRESH_TOKEN_EXPIRE_DAYS in settings.
     Each login creates a new session row — multiple devices are supported.
+    Does not commit; the calling route commits once for the whole login.
     """
     session_id = str(uuid.uuid4())
-    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     db.execute(
-        text("""
-            INSERT INTO user_sessions (session_id, user_id, token, expires_at)
-            VALUES (:session_id, :user_id, :token, :expires_at)
-        """),
+        _INSERT_SESSION,
         {
             "session_id": session_id,
             "user_id": user_id,
-            "token": refresh_token,
-            "expires_at": expires_at,
+            "token_hash": _hash_session_token(refresh_token),
+            "expire_days": settings.REFRESH_TOKEN_EXPIRE_DAYS,
         },
     )
-    db.commit()
 
 
 def _revoke_session(db: Session, refresh_token: str):
     """
     Soft-revoke a session by setting revoked_at timestamp.
     The session row is kept for audit purposes but will fail validation checks.
+    Does not commit; the calling route commits.
     """
-    db.execute(
-        text("""
-            UPDATE user_sessions
-            SET revoked_at = :now
-            WHERE token = :token
-        """),
-        {"now": datetime.utcnow(), "token": refresh_token},
-    )
-    db.commit()
+    db.execute(_REVOKE_SESSION, {"token_hash": _hash_session_token(refresh_token)})
 
 
 def _is_session_valid(db: Session, refresh_token: str) -> bool:
@@ -127,24 +199,20 @@ def _is_session_valid(db: Session, refresh_token: str) -> bool:
     Returns True if valid, False otherwise.
     """
     result = db.execute(
-        text("""
-            SELECT session_id FROM user_sessions
-            WHERE token = :token
-            AND revoked_at IS NULL
-            AND expires_at > :now
-        """),
-        {"token": refresh_token, "now": datetime.utcnow()},
+        _SELECT_VALID_SESSION,
+        {"token_hash": _hash_session_token(refresh_token)},
     ).fetchone()
     return result is not None
 
 
-def _update_last_login(db: Session, user_id: str):
-    """Update the last_login timestamp for a user on every successful login."""
-    db.execute(
-        text("UPDATE users SET last_login = :now WHERE user_id = :user_id"),
-        {"now": datetime.utcnow(), "user_id": user_id},
-    )
-    db.commit()
+def _start_session(db: Session, user_id: str, refresh_token: str):
+    """
+    Record a successful login: store the refresh token session and stamp last_login.
+    Both writes share the caller's transaction, so a login costs a single commit.
+    Does not commit.
+    """
+    _create_session(db, user_id, refresh_token)
+    db.execute(_STAMP_LAST_LOGIN, {"user_id": user_id})
 
 
 def _revoke_all_sessions_for_user(db: Session, user_id: str):
@@ -152,16 +220,120 @@ def _revoke_all_sessions_for_user(db: Session, user_id: str):
     Revoke all active sessions for a user at once.
     Called after a password reset to force re-login on all devices.
     Only affects sessions that haven't already been revoked.
+    Does not commit; the calling route commits.
     """
-    db.execute(
-        text("""
-            UPDATE user_sessions
-            SET revoked_at = :now
-            WHERE user_id = :user_id AND revoked_at IS NULL
-        """),
-        {"now": datetime.utcnow(), "user_id": user_id},
+    db.execute(_REVOKE_ALL_USER_SESSIONS, {"user_id": user_id})
+
+
+def _revoke_all_sessions_in_background(user_id: str):
+    """
+    BackgroundTasks entry point for _revoke_all_sessions_for_user.
+    Runs after the response is sent, so it opens its own DB session rather
+    than reusing the request's, which get_db has already closed.
+    """
+    db = SessionLocal()
+    try:
+        _revoke_all_sessions_for_user(db, user_id)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _raise_registration_conflict(db: Session, email: str):
+    """
+    Turn a unique-key violation on users into the matching 409.
+    Only runs after the INSERT has failed, so the happy path never pre-checks.
+    """
+    email_taken = db.execute(_EMAIL_EXISTS, {"email": email}).fetchone()
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An account with this email already exists",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="This username is already taken",
     )
-    db.commit()
+
+
+def _google_tokeninfo_expiry(_key: str, google_data: dict, now: float) -> float:
+    """Keep a verified token no longer than GOOGLE_TOKENINFO_CACHE_SECONDS or its own exp."""
+    try:
+        token_exp = float(google_data.get("exp", 0))
+    except (TypeError, ValueError):
+        token_exp = 0.0
+    return min(now + GOOGLE_TOKENINFO_CACHE_SECONDS, token_exp)
+
+
+# Successful tokeninfo responses keyed by SHA-256 of the ID token, so a client
+# retrying the same token does not pay another round trip to Google
+_google_tokeninfo_cache: TLRUCache = TLRUCache(
+    maxsize=GOOGLE_TOKENINFO_CACHE_MAX_ENTRIES,
+    ttu=_google_tokeninfo_expiry,
+    timer=time.time,
+)
+_google_tokeninfo_cache_lock = threading.Lock()
+
+
+# One pooled client for Google's OAuth API so repeat verifications reuse an open
+# keep-alive TLS connection instead of handshaking per request
+_google_client: Optional[httpx.Client] = None
+_google_client_lock = threading.Lock()
+
+
+def _get_google_client() -> httpx.Client:
+    global _google_client
+    with _google_client_lock:
+        if _google_client is None:
+            _google_client = httpx.Client(
+                base_url="https://oauth2.googleapis.com",
+                timeout=GOOGLE_OAUTH_TIMEOUT_SECONDS,
+            )
+        return _google_client
+
+
+def close_google_client():
+    """Close the pooled Google client; called from the app lifespan on shutdown."""
+    global _google_client
+    with _google_client_lock:
+        if _google_client is not None:
+            _google_client.close()
+            _google_client = None
+
+
+def _verify_google_id_token(id_token: str) -> dict:
+    """
+    Return Google's tokeninfo claims for id_token, raising 401/503 on failure.
+    Only successful verifications are cached; rejected tokens always re-check.
+    """
+    cache_key = hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+    with _google_tokeninfo_cache_lock:
+        cached = _google_tokeninfo_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = _get_google_client().get("/tokeninfo", params={"id_token": id_token})
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid Google token",
+            )
+        google_data = response.json()
+    except httpx.RequestError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not reach Google OAuth service",
+        )
+
+    with _google_tokeninfo_cache_lock:
+        _google_tokeninfo_cache[cache_key] = google_data
+    return google_data
+
+
+def _hash_reset_token(reset_token: str) -> str:
+    """Only the SHA-256 of a reset token is stored, so a leaked users table can't reset passwords."""
+    return hashlib.sha256(reset_token.encode("utf-8")).hexdigest()
 
 
 def _build_password_reset_link(reset_token: str) -> str:
@@ -221,45 +393,33 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)):
     Create a new account with email and password.
     Acceptance criteria: user data stored with hashed password, returns tokens.
     """
-    # Block duplicate emails — each account must have a unique email
-    if _get_user_by_email(db, payload.email):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="An account with this email already exists",
-        )
-
-    # Block duplicate usernames — each account must have a unique username
-    existing_username = db.execute(
-        text("SELECT user_id FROM users WHERE username = :username"),
-        {"username": payload.username},
-    ).fetchone()
-    if existing_username:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="This username is already taken",
-        )
-
-    # Generate UUID and store user with bcrypt-hashed password
+    # Generate UUID and store user with bcrypt-hashed password. Email and username
+    # uniqueness is enforced by the users UNIQUE keys rather than pre-check SELECTs.
     user_id = str(uuid.uuid4())
-    db.execute(
-        text("""
-            INSERT INTO users (user_id, email, password_hash, username)
-            VALUES (:user_id, :email, :password_hash, :username)
-        """),
-        {
-            "user_id": user_id,
-            "email": payload.email,
-            "password_hash": hash_password(payload.password),
-            "username": payload.username,
-        },
-    )
-    db.commit()
+    pending_hash = submit_hash_password(payload.password)
 
-    # Issue both access token (short-lived) and refresh token (long-lived)
+    # Issue both access token (short-lived) and refresh token (long-lived).
+    # The tokens don't depend on the hash, so they're signed while bcrypt runs.
     access_token = create_access_token(user_id)
     refresh_token = create_refresh_token(user_id)
+    password_hash = pending_hash.result()
+
+    # User, session and last_login go in one transaction with a single commit
+    try:
+        db.execute(
+            _INSERT_PASSWORD_USER,
+            {
+                "user_id": user_id,
+                "email": payload.email,
+                "password_hash": password_hash,
+                "username": payload.username,
+            },
+        )
+    except IntegrityError:
+        db.rollback()
+        _raise_registration_conflict(db, payload.email)
     _create_session(db, user_id, refresh_token)
-    _update_last_login(db, user_id)
+    db.commit()
 
     return RegisterResponse(
         user_id=user_id,
@@ -290,7 +450,7 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             detail="Invalid email or password",
         )
 
-    if not verify_password(payload.password, user.password_hash):
+    if not submit_verify_password(payload.password, user.password_hash).result():
         log_action(db, user.user_id, "FAILED_LOGIN", request=request)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -303,12 +463,24 @@ def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)
             detail=ACCOUNT_DISABLED_DETAIL,
         )
 
+    # The plaintext is only available here, so legacy hashes are upgraded on login.
+    # The new hash is computed on the password pool while the tokens are signed.
+    pending_hash = None
+    if password_needs_rehash(user.password_hash):
+        pending_hash = submit_hash_password(payload.password)
+
     # Issue both access token (short-lived) and refresh token (long-lived)
     access_token = create_access_token(user.user_id)
     refresh_token = create_refresh_token(user.user_id)
-    _create_session(db, user.user_id, refresh_token)
-    _update_last_login(db, user.user_id)
 
+    if pending_hash is not None:
+        db.execute(
+            _UPDATE_PASSWORD_HASH,
+            {"password_hash": pending_hash.result(), "user_id": user.user_id},
+        )
+    _start_session(db, user.user_id, refresh_token)
+
+    # log_action commits the session, last_login, any rehash and the audit row together
     log_action(db, user.user_id, "LOGIN", request=request)
 
     return LoginResponse(
@@ -337,22 +509,7 @@ def oauth_login(payload: OAuthRequest, db: Session = Depends(get_db)):
         )
 
     # Verify the Google ID token by calling Google's tokeninfo endpoint
-    try:
-        response = httpx.get(
-            f"https://oauth2.googleapis.com/tokeninfo?id_token={payload.id_token}",
-            timeout=10.0,
-        )
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid Google token",
-            )
-        google_data = response.json()
-    except httpx.RequestError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Could not reach Google OAuth service",
-        )
+    google_data = _verify_google_id_token(payload.id_token)
 
     # Validate token audience matches our configured Google client IDs
     audience = google_data.get("aud")
@@ -393,35 +550,44 @@ def oauth_login(payload: OAuthRequest, db: Session = Depends(get_db)):
         is_new_user = True
         user_id = str(uuid.uuid4())
 
-        # Generate a unique username — append incrementing counter if base name is taken
-        base_username = name[:47] if len(name) > 47 else name
-        if not base_username:
-            base_username = f"user_{uuid.uuid4().hex[:8]}"
+        # Try the plain display name first; if the unique index rejects it, retry
+        # with a short random suffix instead of probing counters one query at a time
+        base_username = name[:USERNAME_MAX_LENGTH] if name else f"user_{uuid.uuid4().hex[:8]}"
         username = base_username
-        counter = 1
-        while db.execute(
-            text("SELECT user_id FROM users WHERE username = :username"),
-            {"username": username},
-        ).fetchone():
-            username = f"{base_username}{counter}"
-            counter += 1
-
-        # OAuth users have no password_hash — they always authenticate via Google
-        db.execute(
-            text("""
-                INSERT INTO users (user_id, email, username, oauth_provider, oauth_provider_id)
-                VALUES (:user_id, :email, :username, :provider, :provider_id)
-            """),
-            {
-                "user_id": user_id,
-                "email": email,
-                "username": username,
-                "provider": "google",
-                "provider_id": google_id,
-            },
-        )
-        db.commit()
-        user = _get_user_by_id(db, user_id)
+
+        # OAuth users have no password_hash — they always authenticate via Google.
+        # Not committed yet: the session below joins the same transaction.
+        user = None
+        for _ in range(OAUTH_USERNAME_ATTEMPTS):
+            try:
+                db.execute(
+                    _INSERT_OAUTH_USER,
+                    {
+                        "user_id": user_id,
+                        "email": email,
+                        "username": username,
+                        "provider": "google",
+                        "provider_id": google_id,
+                    },
+                )
+                user = SimpleNamespace(user_id=user_id, email=email, username=username, is_banned=False)
+                break
+            except IntegrityError:
+                db.rollback()
+                # A concurrent sign-in may have just created this account
+                user = _get_user_by_email(db, email)
+                if user:
+                    is_new_user = False
+                    break
+                # Otherwise the username was taken
+                suffix = secrets.token_hex(OAUTH_USERNAME_SUFFIX_BYTES)
+                username = f"{base_username[:USERNAME_MAX_LENGTH - len(suffix)]}{suffix}"
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Could not create an account for this Google user, please try again",
+            )
 
     if bool(getattr(user, "is_banned", False)):
         raise HTTPException(
@@ -432,8 +598,8 @@ def oauth_login(payload: OAuthRequest, db: Session = Depends(get_db)):
     # Issue tokens for both new and existing OAuth users
     access_token = create_access_token(user.user_id)
     refresh_token = create_refresh_token(user.user_id)
-    _create_session(db, user.user_id, refresh_token)
-    _update_last_login(db, user.user_id)
+    _start_session(db, user.user_id, refresh_token)
+    db.commit()
 
     return OAuthResponse(
         user_id=user.user_id,
@@ -478,22 +644,12 @@ def refresh_token(payload: RefreshRequest, db: Session = Depends(get_db)):
 # ── Verify Access Token ───────────────────────────────────────────────────────
 
 @router.get("/verify", response_model=VerifyTokenResponse)
-def verify_token(
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
-):
+def verify_token(user=Depends(get_current_user)):
     """
     Verify the access token and return basic user info when valid.
     Used by the frontend on app startup to restore a session without re-logging in.
-    The token itself is validated by the get_current_user_id dependency.
+    The token itself is validated by the get_current_user dependency.
     """
-    user = _get_user_by_id(db, user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-
     return VerifyTokenResponse(
         user_id=user.user_id,
         email=user.email,
@@ -512,10 +668,13 @@ def logout(payload: LogoutRequest, request: Request, db: Session = Depends(get_d
     """
     user_id = decode_refresh_token(payload.refresh_token)
     _revoke_session(db, payload.refresh_token)
-    
+
     if user_id:
+        # log_action commits the revocation along with the audit row
         log_action(db, user_id, "LOGOUT", request=request)
-        
+    else:
+        db.commit()
+
     return {"message": "Successfully logged out"}
 
 
@@ -527,7 +686,7 @@ def request_password_reset(payload: PasswordResetRequest, db: Session = Depends(
     Generate a password reset token and send it via email.
     Always returns the same generic success message regardless of whether the
     email exists — this prevents email enumeration attacks.
-    Token is stored in the users table with an expiry timestamp.
+    Only the token's SHA-256 hash is stored in the users table, with an expiry timestamp.
     In DEBUG mode, the raw token is also returned in the response for local testing.
     """
     user = _get_user_by_email(db, payload.email)
@@ -536,19 +695,12 @@ def request_password_reset(payload: PasswordResetRequest, db: Session = Depends(
     if user:
         # Generate a cryptographically secure random token
         reset_token = secrets.token_urlsafe(32)
-        expires_at = datetime.utcnow() + timedelta(
-            minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES
-        )
-        # Store token and expiry on the user row
+        # Store the token hash and expiry on the user row
         db.execute(
-            text("""
-                UPDATE users
-                SET reset_token = :reset_token, reset_token_expiry = :expiry
-                WHERE user_id = :user_id
-            """),
+            _SET_RESET_TOKEN,
             {
-                "reset_token": reset_token,
-                "expiry": expires_at,
+                "reset_token": _hash_reset_token(reset_token),
+                "expire_minutes": settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES,
                 "user_id": user.user_id,
             },
         )
@@ -577,23 +729,20 @@ def request_password_reset(payload: PasswordResetRequest, db: Session = Depends(
 def confirm_password_reset(
     payload: PasswordResetConfirmRequest,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
     Reset the user's password using a valid reset token.
     Validates that the token exists and has not expired.
     On success: updates password hash, clears the reset token, and
-    revokes all existing sessions to force re-login on all devices.
+    revokes all existing sessions (after the response is sent) to force
+    re-login on all devices.
     """
-    # Look up user by token — also checks expiry in the query for atomicity
+    # Look up user by token hash — also checks expiry in the query for atomicity
     user = db.execute(
-        text("""
-            SELECT * FROM users
-            WHERE reset_token = :token
-            AND reset_token_expiry IS NOT NULL
-            AND reset_token_expiry > :now
-        """),
-        {"token": payload.token, "now": datetime.utcnow()},
+        _SELECT_USER_BY_RESET_TOKEN,
+        {"token_hash": _hash_reset_token(payload.token)},
     ).fetchone()
 
     if not user:
@@ -603,24 +752,19 @@ def confirm_password_reset(
         )
 
     # Update password and clear the reset token so it can't be reused
+    password_hash = submit_hash_password(payload.new_password).result()
     db.execute(
-        text("""
-            UPDATE users
-            SET password_hash = :password_hash,
-                reset_token = NULL,
-                reset_token_expiry = NULL
-            WHERE user_id = :user_id
-        """),
+        _RESET_PASSWORD,
         {
-            "password_hash": hash_password(payload.new_password),
+            "password_hash": password_hash,
             "user_id": user.user_id,
         },
     )
-    db.commit()
-
-    # Revoke all active sessions — user must log in again with new password
-    _revoke_all_sessions_for_user(db, user.user_id)
 
+    # log_action commits the new password and audit row together
     log_action(db, user.user_id, "PASSWORD_RESET", request=request)
 
+    # Revoke all active sessions — user must log in again with new password
+    background_tasks.add_task(_revoke_all_sessions_in_background, user.user_id)
+
     return MessageResponse(message="Password reset successful")
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field, field_validator
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.api.anchor import invalidate_anchor_caches
 from app.core.database import get_db
 from app.core.dependencies import get_current_user_id
 
@@ -266,6 +267,7 @@ def join_circle(
         {"circle_id": circle_id, "user_id": user_id},
     )
     db.commit()
+    invalidate_anchor_caches()
     return {"message": "Successfully joined the circle"}
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -392,6 +394,7 @@ def invite_member(
         {"circle_id": circle_id, "user_id": target.user_id},
     )
     db.commit()
+    invalidate_anchor_caches()
 
     return {"message": f"{payload.username} has been added to the circle"}
 
@@ -435,5 +438,6 @@ def remove_member(
         {"circle_id": circle_id, "target_user_id": target_user_id},
     )
     db.commit()
+    invalidate_anchor_caches()
 
     return {"message": "Member removed successfully"}
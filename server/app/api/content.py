@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.api.anchor import invalidate_anchor_caches
 from app.core.database import get_db
 from app.core.dependencies import get_current_user_id
 from app.core.s3 import upload_to_s3, validate_upload
@@ -78,6 +79,7 @@ def add_text_content(
         {"content_id": content_id, "text_body": body.text_body, "language": body.language},
     )
     db.commit()
+    invalidate_anchor_caches(anchor_id)
 
     return ContentResponse(
         content_id=content_id,
@@ -131,6 +133,7 @@ def add_link_content(
         },
     )
     db.commit()
+    invalidate_anchor_caches(anchor_id)
 
     return ContentResponse(
         content_id=content_id,
@@ -192,6 +195,7 @@ async def upload_file_content(
         },
     )
     db.commit()
+    invalidate_anchor_caches(anchor_id)
 
     return ContentResponse(
         content_id=content_id,
@@ -278,5 +282,6 @@ def delete_content(
         {"content_id": content_id},
     )
     db.commit()
+    invalidate_anchor_caches(anchor_id)
 
     return {"message": "Content deleted", "content_id": content_id}
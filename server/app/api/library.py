@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.api.anchor import invalidate_anchor_caches
 from app.core.audit import log_action
 from app.core.database import get_db
 from app.core.dependencies import get_current_user_id
@@ -71,7 +72,8 @@ def _expire_past_due_anchors(
     *,
     now: Optional[datetime] = None,
     anchor_id: Optional[str] = None,
-):
+) -> int:
+    """Expire ACTIVE anchors past their expiration_time; returns how many changed."""
     current_time = now or datetime.utcnow()
     query = """
         UPDATE anchors
@@ -84,7 +86,7 @@ def _expire_past_due_anchors(
     if anchor_id:
         query += " AND anchor_id = :anchor_id"
         params["anchor_id"] = anchor_id
-    db.execute(text(query), params)
+    return db.execute(text(query), params).rowcount
 
 
 def _refresh_saved_anchor_expiration_statuses(
@@ -94,7 +96,7 @@ def _refresh_saved_anchor_expiration_statuses(
     now: Optional[datetime] = None,
 ):
     current_time = now or datetime.utcnow()
-    _expire_past_due_anchors(db, now=current_time)
+    expired_count = _expire_past_due_anchors(db, now=current_time)
     db.execute(
         text("""
             UPDATE saved_anchors sa
@@ -109,6 +111,8 @@ def _refresh_saved_anchor_expiration_statuses(
         {"user_id": user_id, "now": current_time},
     )
     db.commit()
+    if expired_count:
+        invalidate_anchor_caches()
 
 
 def _normalize_expiration_status_filter(raw_status: Optional[str]) -> Optional[str]:
@@ -178,7 +182,7 @@ def save_anchor(
             detail="Anchor is already in your library",
         )
 
-    _expire_past_due_anchors(db, anchor_id=payload.anchor_id)
+    expired_count = _expire_past_due_anchors(db, anchor_id=payload.anchor_id)
     expiration_status = _compute_expiration_status(
         anchor.status,
         anchor.expiration_time,
@@ -195,6 +199,8 @@ def save_anchor(
         },
     )
     db.commit()
+    if expired_count:
+        invalidate_anchor_caches(payload.anchor_id)
 
     saved = _fetch_saved_row(db, user_id, payload.anchor_id)
     log_action(
@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.api.anchor import invalidate_anchor_caches
 from app.core.database import get_db
 from app.core.dependencies import get_current_user_id
 from app.schemas.report import CreateReportRequest, ReportResponse
@@ -78,6 +79,7 @@ def report_anchor(
     )
 
     # Auto-flag anchor if PENDING report count hits threshold
+    flagged = False
     if anchor.status == "ACTIVE":
         report_count = db.execute(
             text("SELECT COUNT(*) AS cnt FROM reports WHERE anchor_id = :anchor_id AND status = 'PENDING'"),
@@ -89,8 +91,11 @@ def report_anchor(
                 text("UPDATE anchors SET status = 'FLAGGED' WHERE anchor_id = :anchor_id"),
                 {"anchor_id": anchor_id},
             )
+            flagged = True
 
     db.commit()
+    if flagged:
+        invalidate_anchor_caches(anchor_id)
 
     return ReportResponse(
         report_id=report_id,
@@ -6,11 +6,13 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from app.api.anchor import invalidate_anchor_caches
 from app.core.audit import log_action
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user_id
+from app.core.dependencies import forget_cached_user, get_current_user_id
 from app.schemas.user import (
     BlockedUserResponse,
     BlockUserRequest,
@@ -21,6 +23,52 @@ from app.schemas.user import (
 router = APIRouter(tags=["User"])
 
 
+def _get_user_profile_by_id(db: Session, user_id: str):
+    """Fetch just the columns ProfileResponse needs. Returns None if not found."""
+    return db.execute(
+        text("""
+            SELECT user_id, email, username, bio, avatar_url, is_ghost_mode
+            FROM users
+            WHERE user_id = :user_id
+        """),
+        {"user_id": user_id},
+    ).fetchone()
+
+
+# Unset (None) fields keep their current value, so one static statement covers
+# every combination of provided fields
+_PROFILE_UPDATE_FIELDS = {"username", "email", "bio", "avatar_url", "is_ghost_mode"}
+_UPDATE_PROFILE = text("""
+    UPDATE users
+    SET username = COALESCE(:username, username),
+        email = COALESCE(:email, email),
+        bio = COALESCE(:bio, bio),
+        avatar_url = COALESCE(:avatar_url, avatar_url),
+        is_ghost_mode = COALESCE(:is_ghost_mode, is_ghost_mode)
+    WHERE user_id = :user_id
+""")
+
+
+def _raise_profile_conflict(db: Session, payload: UpdateProfileRequest, user_id: str):
+    """Work out which unique field an update collided on and raise the matching 409."""
+    if payload.email and db.execute(
+        text("SELECT 1 FROM users WHERE email = :email AND user_id != :user_id"),
+        {"email": payload.email, "user_id": user_id},
+    ).fetchone():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This email is already in use by another account",
+        )
+    if payload.username and db.execute(
+        text("SELECT 1 FROM users WHERE username = :username AND user_id != :user_id"),
+        {"username": payload.username, "user_id": user_id},
+    ).fetchone():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This username is already taken",
+        )
+
+
 # ── Get Profile ───────────────────────────────────────────────────────────────
 
 @router.get("/user/profile", response_model=ProfileResponse)
@@ -29,10 +77,7 @@ def get_profile(
     db: Session = Depends(get_db),
 ):
     """Get the current user's profile."""
-    user = db.execute(
-        text("SELECT * FROM users WHERE user_id = :user_id"),
-        {"user_id": user_id},
-    ).fetchone()
+    user = _get_user_profile_by_id(db, user_id)
 
     if not user:
         raise HTTPException(
@@ -40,14 +85,7 @@ def get_profile(
             detail="User not found",
         )
 
-    return ProfileResponse(
-        user_id=user.user_id,
-        email=user.email,
-        username=user.username,
-        bio=user.bio,
-        avatar_url=user.avatar_url,
-        is_ghost_mode=user.is_ghost_mode,
-    )
+    return ProfileResponse.model_validate(user)
 
 
 # ── Update Profile ────────────────────────────────────────────────────────────
@@ -60,68 +98,24 @@ def update_profile(
 ):
     """
     Update profile fields. Only provided fields are updated.
-    US4 #4 — checks email uniqueness before updating.
+    US4 #4 — email and username uniqueness is enforced by their unique indexes;
+    a duplicate is reported as 409 instead of pre-checked with extra SELECTs.
     """
-    # Check email uniqueness if email is being changed (US4 #4)
-    if payload.email:
-        existing = db.execute(
-            text("SELECT user_id FROM users WHERE email = :email AND user_id != :user_id"),
-            {"email": payload.email, "user_id": user_id},
-        ).fetchone()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="This email is already in use by another account",
-            )
-
-    # Check username uniqueness if username is being changed
-    if payload.username:
-        existing = db.execute(
-            text("SELECT user_id FROM users WHERE username = :username AND user_id != :user_id"),
-            {"username": payload.username, "user_id": user_id},
-        ).fetchone()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="This username is already taken",
-            )
-
-    # Build dynamic update query from only the fields provided
-    fields = {}
-    if payload.username is not None:
-        fields["username"] = payload.username
-    if payload.email is not None:
-        fields["email"] = payload.email
-    if payload.bio is not None:
-        fields["bio"] = payload.bio
-    if payload.avatar_url is not None:
-        fields["avatar_url"] = payload.avatar_url
-    if payload.is_ghost_mode is not None:
-        fields["is_ghost_mode"] = payload.is_ghost_mode
-
-    if fields:
-        set_clause = ", ".join(f"{k} = :{k}" for k in fields)
-        fields["user_id"] = user_id
-        db.execute(
-            text(f"UPDATE users SET {set_clause} WHERE user_id = :user_id"),
-            fields,
-        )
-        db.commit()
+    fields = payload.model_dump(include=_PROFILE_UPDATE_FIELDS)
+    if any(value is not None for value in fields.values()):
+        try:
+            db.execute(_UPDATE_PROFILE, {**fields, "user_id": user_id})
+            db.commit()
+            forget_cached_user(user_id)
+        except IntegrityError:
+            db.rollback()
+            _raise_profile_conflict(db, payload, user_id)
+            raise
 
     # Return updated profile
-    user = db.execute(
-        text("SELECT * FROM users WHERE user_id = :user_id"),
-        {"user_id": user_id},
-    ).fetchone()
+    user = _get_user_profile_by_id(db, user_id)
 
-    return ProfileResponse(
-        user_id=user.user_id,
-        email=user.email,
-        username=user.username,
-        bio=user.bio,
-        avatar_url=user.avatar_url,
-        is_ghost_mode=user.is_ghost_mode,
-    )
+    return ProfileResponse.model_validate(user)
 
 
 @router.get("/users/blocked", response_model=List[BlockedUserResponse])
@@ -145,15 +139,7 @@ def list_blocked_users(
         {"user_id": user_id},
     ).fetchall()
 
-    return [
-        BlockedUserResponse(
-            user_id=row.user_id,
-            username=row.username,
-            avatar_url=row.avatar_url,
-            blocked_at=row.blocked_at,
-        )
-        for row in rows
-    ]
+    return [BlockedUserResponse.model_validate(row) for row in rows]
 
 
 @router.post("/users/block", response_model=BlockedUserResponse, status_code=status.HTTP_200_OK)
@@ -192,6 +178,7 @@ def block_user(
         {"blocker_id": user_id, "blocked_user_id": payload.blocked_user_id},
     )
     db.commit()
+    invalidate_anchor_caches()
 
     blocked_row = db.execute(
         text("""
@@ -251,6 +238,7 @@ def unblock_user(
         {"blocker_id": user_id, "blocked_user_id": payload.blocked_user_id},
     )
     db.commit()
+    invalidate_anchor_caches()
 
     log_action(
         db,
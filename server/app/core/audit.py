@@ -1,5 +1,6 @@
 import uuid
-import json
+
+import orjson
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -18,7 +19,7 @@ def log_action(
     Logs an action to the audit_logs table.
     """
     ip_address = request.client.host if request and request.client else None
-    metadata_json = json.dumps(metadata) if metadata else None
+    metadata_json = orjson.dumps(metadata).decode() if metadata else None
     
     db.execute(
         text("""
@@ -1,11 +1,20 @@
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional, Set
 
 
 class Settings(BaseSettings):
+    # Read once from the environment/.env; frozen so nothing reassigns a field at runtime
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
+
     # ── App ──────────────────────────────────────────────────────────────────
     APP_NAME: str = "Anchor"
     DEBUG: bool = False
+    # Set by tests/conftest.py; switches to cheap bcrypt hashing
+    TESTING: bool = False
+    # Worker threads for sync (def) route handlers — each can hold one DB connection
+    THREADPOOL_MAX_WORKERS: int = 40
 
     # ── Database ─────────────────────────────────────────────────────────────
     DB_HOST: str = "localhost"
@@ -13,20 +22,54 @@ class Settings(BaseSettings):
     DB_USER: str = "anchor_user"
     DB_PASSWORD: str = "changeme"
     DB_NAME: str = "anchor_db"
+    # SQLAlchemy MySQL driver: "pymysql" (pure Python, always installed) or
+    # "mysqldb" (mysqlclient's C extension — faster row decoding, needs libmysqlclient)
+    DB_DRIVER: str = "pymysql"
+    # Connection pool — pool_size stays open, max_overflow is opened on demand
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40     # pool_size + overflow must cover THREADPOOL_MAX_WORKERS
+    DB_POOL_TIMEOUT: int = 30      # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600    # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True  # ping on checkout; costs a round trip, catches dead connections
 
-    @property
+    # Built once on first access; the DB_* fields don't change after startup
+    @cached_property
     def DATABASE_URL(self) -> str:
         return (
-            f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}"
+            f"mysql+{self.DB_DRIVER}://{self.DB_USER}:{self.DB_PASSWORD}"
             f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
         )
 
+    # ── Caching ───────────────────────────────────────────────────────────────
+    # Per-process cache of serialized /anchors/nearby responses; 0 disables it
+    NEARBY_CACHE_TTL_SECONDS: int = 0
+    NEARBY_CACHE_MAX_ENTRIES: int = 10000
+    # Per-process cache of non-ACTIVE anchor status used to reject unlocks early; 0 disables it
+    UNLOCK_GATE_CACHE_TTL_SECONDS: int = 0
+    UNLOCK_GATE_CACHE_MAX_ENTRIES: int = 10000
+    # Per-process cache of user identity/ban flag read by auth checks; 0 disables it
+    USER_CACHE_TTL_SECONDS: int = 0
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
     # ── Auth / JWT ────────────────────────────────────────────────────────────
     SECRET_KEY: str = "CHANGE_ME_IN_PRODUCTION"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60          # 1 hour
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # ── Passwords ─────────────────────────────────────────────────────────────
+    # bcrypt cost factor; each +1 doubles hashing time. Forced to 4 when TESTING.
+    BCRYPT_ROUNDS: int = 12
+    # Server-side secret mixed into every password before bcrypt. Changing it
+    # invalidates all peppered password hashes — set once per deployment.
+    PASSWORD_PEPPER: str = ""
+    # Threads dedicated to bcrypt; 0 means one per CPU core
+    PASSWORD_HASH_WORKERS: int = 0
+
+    @property
+    def BCRYPT_EFFECTIVE_ROUNDS(self) -> int:
+        return 4 if self.TESTING else self.BCRYPT_ROUNDS
+
     # ── Password Reset ────────────────────────────────────────────────────────
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 30
     PASSWORD_RESET_DEEP_LINK_BASE: str = "anchor://reset-password"
@@ -60,9 +103,11 @@ class Settings(BaseSettings):
     AWS_REGION: str = "us-east-2"
     S3_BUCKET_NAME: str = "anchor-avatars"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings instance; usable as a FastAPI dependency."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -2,28 +2,82 @@
 FastAPI dependencies — reusable across all route files.
 """
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import threading
+
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import decode_access_token
 
-bearer_scheme = HTTPBearer()
+class BearerToken(HTTPBearer):
+    """
+    HTTPBearer that slices the raw token straight off the Authorization header.
+    Subclassing keeps the bearer scheme in the OpenAPI docs while skipping the
+    HTTPAuthorizationCredentials object built for every request.
+    """
+
+    async def __call__(self, request: Request) -> str:
+        authorization = request.headers.get("authorization", "")
+        if authorization[:7].lower() != "bearer " or not authorization[7:].strip():
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return authorization[7:].strip()
+
+
+bearer_scheme = BearerToken(scheme_name="HTTPBearer")
 ACCOUNT_DISABLED_DETAIL = "This account has been disabled"
 
+# Identity and ban flag per user_id, read on every authenticated request.
+# Writers to these columns call forget_cached_user, but that only clears this
+# worker — other processes keep honoring a banned user until the TTL runs out,
+# so the cache stays off unless USER_CACHE_TTL_SECONDS opts into that window.
+_user_cache: TTLCache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_ENTRIES,
+    ttl=max(settings.USER_CACHE_TTL_SECONDS, 1),
+)
+_user_cache_lock = threading.Lock()
+
+
+def get_cached_user(db: Session, user_id: str):
+    """Return (user_id, email, username, is_banned) for a user, or None if not found."""
+    if settings.USER_CACHE_TTL_SECONDS > 0:
+        with _user_cache_lock:
+            user = _user_cache.get(user_id)
+        if user is not None:
+            return user
 
-def ensure_user_is_active(db: Session, user_id: str):
     user = db.execute(
         text("""
-            SELECT user_id, is_banned
+            SELECT user_id, email, username, is_banned
             FROM users
             WHERE user_id = :user_id
         """),
         {"user_id": user_id},
     ).fetchone()
 
+    if user is not None and settings.USER_CACHE_TTL_SECONDS > 0:
+        with _user_cache_lock:
+            _user_cache[user_id] = user
+    return user
+
+
+def forget_cached_user(user_id: str):
+    """Drop a user's cached row after their email, username or ban flag changes."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def ensure_user_is_active(db: Session, user_id: str):
+    user = get_cached_user(db, user_id)
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -41,14 +95,20 @@ def ensure_user_is_active(db: Session, user_id: str):
 
 
 def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    request: Request,
+    token: str = Depends(bearer_scheme),
     db: Session = Depends(get_db),
 ) -> str:
     """
     Extracts and validates the JWT from the Authorization: Bearer <token> header.
     Returns the user_id string if valid, raises 401 otherwise.
+    The verified user is kept on request.state, so the token is decoded once per request.
     """
-    user_id = decode_access_token(credentials.credentials)
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user.user_id
+
+    user_id = decode_access_token(token)
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -56,5 +116,10 @@ def get_current_user_id(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    ensure_user_is_active(db, user_id)
+    request.state.current_user = ensure_user_is_active(db, user_id)
     return user_id
+
+
+def get_current_user(request: Request, user_id: str = Depends(get_current_user_id)):
+    """The authenticated user's (user_id, email, username, is_banned) row."""
+    return request.state.current_user
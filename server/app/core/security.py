@@ -1,12 +1,18 @@
 """
 Security helpers:
-- Password hashing with bcrypt (direct library, not passlib)
+- Password hashing with bcrypt (direct library, not passlib), over a peppered HMAC-SHA256 prehash
 - JWT access + refresh token creation and verification using python-jose
 """
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
-from jose import JWTError, jwt
+from cachetools import TTLCache
+from jose import JWTError, jwk, jwt
 import bcrypt
 
 from app.core.config import settings
@@ -18,41 +24,114 @@ from app.core.config import settings
 
 # ── Passwords ─────────────────────────────────────────────────────────────────
 
+# Hashes written by hash_password carry this marker. Without it, a stored hash is
+# plain bcrypt over the raw password (the original format) and is upgraded on login.
+PEPPERED_HASH_PREFIX = "hmac-sha256$"
+
+
+def _prehash_password(plain: str) -> bytes:
+    """
+    HMAC-SHA256 the password with PASSWORD_PEPPER before bcrypt sees it.
+    The hex digest is a fixed 64 bytes with no NULs, so bcrypt's 72-byte
+    truncation can't silently drop part of a long password.
+    """
+    return hmac.new(
+        settings.PASSWORD_PEPPER.encode("utf-8"),
+        plain.encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest().encode("ascii")
+
+
 def hash_password(plain: str) -> str:
     """
     Hash a plain text password using bcrypt.
     A new random salt is generated for every call, so two hashes of the
     same password will always be different — this prevents rainbow table attacks.
+    Cost comes from BCRYPT_ROUNDS (4 under TESTING so the suite stays fast).
     Returns the hash as a UTF-8 string for storage in the database.
     """
-    pwd_bytes = plain.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed_bytes = bcrypt.hashpw(pwd_bytes, salt)
-    return hashed_bytes.decode("utf-8")
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_EFFECTIVE_ROUNDS)
+    hashed_bytes = bcrypt.hashpw(_prehash_password(plain), salt)
+    return PEPPERED_HASH_PREFIX + hashed_bytes.decode("utf-8")
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     """
     Verify a plain text password against a stored bcrypt hash.
     Uses bcrypt.checkpw which handles salt extraction automatically.
+    Accepts both peppered hashes and legacy plain-bcrypt ones.
     Returns True if the password matches, False otherwise.
     """
-    pwd_bytes = plain.encode("utf-8")
-    hashed_bytes = hashed.encode("utf-8")
-    return bcrypt.checkpw(pwd_bytes, hashed_bytes)
+    if hashed.startswith(PEPPERED_HASH_PREFIX):
+        hashed_bytes = hashed[len(PEPPERED_HASH_PREFIX):].encode("utf-8")
+        return bcrypt.checkpw(_prehash_password(plain), hashed_bytes)
+    try:
+        return bcrypt.checkpw(plain.encode("utf-8"), hashed.encode("utf-8"))
+    except ValueError:
+        # bcrypt rejects > 72-byte input; no legacy hash could have matched it
+        return False
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """
+    True when a stored hash should be replaced on the next successful login:
+    it predates the peppered format, or was made at a different bcrypt cost
+    than BCRYPT_ROUNDS (so raising the cost upgrades users as they sign in).
+    """
+    if not hashed.startswith(PEPPERED_HASH_PREFIX):
+        return True
+    # bcrypt hashes look like $2b$12$<salt+digest>; the cost sits between the 2nd and 3rd "$"
+    bcrypt_hash = hashed[len(PEPPERED_HASH_PREFIX):]
+    try:
+        cost = int(bcrypt_hash.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != settings.BCRYPT_EFFECTIVE_ROUNDS
+
+
+# bcrypt releases the GIL, so hashes on this pool run in parallel across cores
+# without the pickling and fork cost of a process pool. Sizing it to the CPU
+# count makes bursts of logins queue here instead of oversubscribing the cores
+# that every other request thread shares.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
+
+def submit_hash_password(plain: str) -> "Future[str]":
+    """Run hash_password on the dedicated password pool; call .result() for the hash."""
+    return _password_executor.submit(hash_password, plain)
+
+
+def submit_verify_password(plain: str, hashed: str) -> "Future[bool]":
+    """Run verify_password on the dedicated password pool; call .result() for the outcome."""
+    return _password_executor.submit(verify_password, plain, hashed)
 
 
 # ── JWT ───────────────────────────────────────────────────────────────────────
 
-def _create_token(data: dict, expires_delta: timedelta) -> str:
+# Signing key built once: given a raw secret, jose would re-parse it and construct
+# a new HMAC key object on every encode and decode
+_JWT_KEY = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+
+# Token lifetimes in seconds, resolved once from settings
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+
+def _create_token(data: dict, ttl_seconds: int) -> str:
     """
     Internal helper to create a signed JWT with an expiry time.
     The payload is copied to avoid mutating the caller's dict.
-    Signed using SECRET_KEY and ALGORITHM from settings (typically HS256).
+    exp is written as an integer epoch directly — what the JWT would carry anyway —
+    so no datetime is built and converted per token.
+    Signed with the prebuilt SECRET_KEY / ALGORITHM key (typically HS256).
     """
     payload = data.copy()
-    payload["exp"] = datetime.utcnow() + expires_delta
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    payload["exp"] = int(time.time()) + ttl_seconds
+    return jwt.encode(payload, _JWT_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_access_token(user_id: str) -> str:
@@ -62,10 +141,7 @@ def create_access_token(user_id: str) -> str:
     The 'type' claim is set to 'access' to prevent refresh tokens
     from being used as access tokens.
     """
-    return _create_token(
-        {"sub": user_id, "type": "access"},
-        timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
-    )
+    return _create_token({"sub": user_id, "type": "access"}, _ACCESS_TOKEN_TTL_SECONDS)
 
 
 def create_refresh_token(user_id: str) -> str:
@@ -75,10 +151,55 @@ def create_refresh_token(user_id: str) -> str:
     The 'type' claim is set to 'refresh' to prevent access tokens
     from being used as refresh tokens.
     """
-    return _create_token(
-        {"sub": user_id, "type": "refresh"},
-        timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
-    )
+    return _create_token({"sub": user_id, "type": "refresh"}, _REFRESH_TOKEN_TTL_SECONDS)
+
+
+# Decoded payloads keyed by the token's SHA-256, so repeat requests with the same
+# bearer token skip JSON parsing and the HMAC check. Keying on the full token
+# (signature included) means a tampered token never matches a cached entry.
+JWT_DECODE_CACHE_SECONDS = 30
+JWT_DECODE_CACHE_MAX_ENTRIES = 10000
+_decode_cache: TTLCache = TTLCache(maxsize=JWT_DECODE_CACHE_MAX_ENTRIES, ttl=JWT_DECODE_CACHE_SECONDS)
+_decode_cache_lock = threading.Lock()
+
+
+def _decode_token(token: str) -> Optional[dict]:
+    """
+    Verify a JWT's signature and expiry and return its payload, or None.
+    Cached payloads are re-checked against exp, so a token that expires
+    while cached is still rejected.
+    """
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    with _decode_cache_lock:
+        payload = _decode_cache.get(cache_key)
+    if payload is not None:
+        return payload if payload["exp"] > time.time() else None
+
+    try:
+        payload = jwt.decode(
+            token,
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS,
+            options={"require_exp": True, "require_sub": True},
+        )
+    except JWTError:
+        return None
+
+    with _decode_cache_lock:
+        _decode_cache[cache_key] = payload
+    return payload
+
+
+def _decode_token_of_type(token: str, expected_type: str) -> Optional[str]:
+    """
+    Return the sub claim of a valid token whose 'type' claim matches, else None.
+    The type is compared with compare_digest and every failure returns the same
+    None, so a wrong-type token is indistinguishable from a bad signature.
+    """
+    payload = _decode_token(token) or {}
+    token_type = str(payload.get("type", ""))
+    type_ok = hmac.compare_digest(token_type.encode("utf-8"), expected_type.encode("utf-8"))
+    return payload.get("sub") if type_ok else None
 
 
 def decode_access_token(token: str) -> Optional[str]:
@@ -86,16 +207,9 @@ def decode_access_token(token: str) -> Optional[str]:
     Decode and validate an access token.
     Verifies signature, expiry, and that the token type is 'access'.
     Returns the user_id (sub claim) if valid, None if invalid or expired.
-    JWTError covers all jose decode failures including expiry and bad signature.
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        # Reject refresh tokens being used in place of access tokens
-        if payload.get("type") != "access":
-            return None
-        return payload.get("sub")
-    except JWTError:
-        return None
+    # Rejects refresh tokens being used in place of access tokens
+    return _decode_token_of_type(token, "access")
 
 
 def decode_refresh_token(token: str) -> Optional[str]:
@@ -103,13 +217,6 @@ def decode_refresh_token(token: str) -> Optional[str]:
     Decode and validate a refresh token.
     Verifies signature, expiry, and that the token type is 'refresh'.
     Returns the user_id (sub claim) if valid, None if invalid or expired.
-    JWTError covers all jose decode failures including expiry and bad signature.
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        # Reject access tokens being used in place of refresh tokens
-        if payload.get("type") != "refresh":
-            return None
-        return payload.get("sub")
-    except JWTError:
-        return None
\ No newline at end of file
+    # Rejects access tokens being used in place of refresh tokens
+    return _decode_token_of_type(token, "refresh")
@@ -4,17 +4,19 @@ Anchor — FastAPI application entry point
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
-from app.api.auth import router as auth_router
+from app.api.auth import close_google_client, router as auth_router
 from app.api.user import router as user_router
 from app.api.anchor import router as anchor_router
 from app.api.report import router as report_router
 from app.api.admin import router as admin_router
 from app.api.content import router as content_router
-from app.core.database import SessionLocal
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
 from app.api.circle import router as circle_router
 from app.api.library import router as library_router
 
@@ -103,6 +105,74 @@ def _bootstrap_core_tables():
                 ADD CONSTRAINT fk_anchors_circle_id
                 FOREIGN KEY (circle_id) REFERENCES circles(circle_id) ON DELETE SET NULL
             """))
+        check_location_index = db.execute(
+            text("SHOW INDEX FROM anchors WHERE Key_name = 'idx_anchors_location'")
+        ).fetchone()
+        if check_location_index is None:
+            db.execute(text("ALTER TABLE anchors ADD SPATIAL INDEX idx_anchors_location (location)"))
+        check_status_visibility_index = db.execute(
+            text("SHOW INDEX FROM anchors WHERE Key_name = 'idx_anchors_status_visibility'")
+        ).fetchone()
+        if check_status_visibility_index is None:
+            db.execute(text("ALTER TABLE anchors ADD INDEX idx_anchors_status_visibility (status, visibility)"))
+        check_reset_token_index = db.execute(
+            text("SHOW INDEX FROM users WHERE Key_name = 'idx_users_reset_token'")
+        ).fetchone()
+        if check_reset_token_index is None:
+            db.execute(text("ALTER TABLE users ADD INDEX idx_users_reset_token (reset_token)"))
+        # email and username are already covered by their UNIQUE constraints
+        for redundant_index in ("idx_users_email", "idx_users_username"):
+            if db.execute(
+                text("SHOW INDEX FROM users WHERE Key_name = :key_name"),
+                {"key_name": redundant_index},
+            ).fetchone() is not None:
+                db.execute(text(f"ALTER TABLE users DROP INDEX {redundant_index}"))
+        check_sessions_user_active_index = db.execute(
+            text("SHOW INDEX FROM user_sessions WHERE Key_name = 'idx_sessions_user_active'")
+        ).fetchone()
+        if check_sessions_user_active_index is None:
+            db.execute(text("ALTER TABLE user_sessions ADD INDEX idx_sessions_user_active (user_id, revoked_at)"))
+        # idx_sessions_user_active now serves the user_id foreign key as well
+        check_sessions_user_index = db.execute(
+            text("SHOW INDEX FROM user_sessions WHERE Key_name = 'idx_sessions_user_id'")
+        ).fetchone()
+        if check_sessions_user_index is not None:
+            db.execute(text("ALTER TABLE user_sessions DROP INDEX idx_sessions_user_id"))
+        # Sessions are looked up by a 32-byte SHA-256 of the refresh token rather
+        # than the full JWT, which keeps the unique index small. DDL auto-commits,
+        # so each step checks its own state and a rerun finishes a partial migration.
+        check_session_token_hash_col = db.execute(
+            text("SHOW COLUMNS FROM user_sessions LIKE 'token_hash'")
+        ).fetchone()
+        if check_session_token_hash_col is None:
+            db.execute(text("ALTER TABLE user_sessions ADD COLUMN token_hash BINARY(32) NULL AFTER user_id"))
+        check_session_token_col = db.execute(
+            text("SHOW COLUMNS FROM user_sessions LIKE 'token'")
+        ).fetchone()
+        if check_session_token_col is not None:
+            db.execute(text("""
+                UPDATE user_sessions
+                SET token_hash = UNHEX(SHA2(token, 256))
+                WHERE token_hash IS NULL
+            """))
+            db.commit()
+        check_session_token_hash_col = db.execute(
+            text("SHOW COLUMNS FROM user_sessions LIKE 'token_hash'")
+        ).fetchone()
+        if check_session_token_hash_col.Null == "YES":
+            db.execute(text("ALTER TABLE user_sessions MODIFY token_hash BINARY(32) NOT NULL"))
+        check_session_token_hash_index = db.execute(
+            text("SHOW INDEX FROM user_sessions WHERE Key_name = 'token_hash'")
+        ).fetchone()
+        if check_session_token_hash_index is None:
+            db.execute(text("ALTER TABLE user_sessions ADD UNIQUE INDEX token_hash (token_hash)"))
+        if check_session_token_col is not None:
+            db.execute(text("ALTER TABLE user_sessions DROP COLUMN token"))
+        check_tags_index = db.execute(
+            text("SHOW INDEX FROM anchors WHERE Key_name = 'idx_anchors_tags'")
+        ).fetchone()
+        if check_tags_index is None:
+            db.execute(text("ALTER TABLE anchors ADD INDEX idx_anchors_tags ((CAST(tags AS CHAR(255) ARRAY)))"))
         saved_anchors_table = db.execute(
             text("SHOW TABLES LIKE 'saved_anchors'")
         ).fetchone()
@@ -135,8 +205,14 @@ def _bootstrap_core_tables():
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
+    # Route handlers are sync and run on AnyIO's worker threads, so this limit —
+    # not the event loop — caps how many requests can wait on MySQL at once
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_MAX_WORKERS
     _bootstrap_core_tables()
     yield
+    close_google_client()
+    # Close pooled MySQL connections cleanly instead of leaving the server to time them out
+    engine.dispose()
 
 
 _bootstrap_core_tables()
@@ -155,6 +231,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # /anchors/nearby pagination
 )
 
 # ── Routers ───────────────────────────────────────────────────────────────────
@@ -168,6 +245,13 @@ app.include_router(circle_router)
 app.include_router(library_router)
 
 
+# Liveness probes hit this constantly, so the body is serialized once at import.
+# A fresh Response wraps it each time because middleware (e.g. CORS) edits the
+# headers of the response it is sent, which would leak across a shared instance.
+_HEALTH_BODY = b'{"status":"ok","app":"Anchor API"}'
+
+
 @app.get("/")
-def health_check():
-    return {"status": "ok", "app": "Anchor API"}
+async def health_check():
+    # async: nothing here blocks, so skip the hop onto the worker threadpool
+    return Response(content=_HEALTH_BODY, media_type="application/json")
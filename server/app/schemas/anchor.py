@@ -4,12 +4,19 @@ Pydantic schemas for Anchor request validation and API responses.
 CreateAnchorRequest  — validates incoming fields when creating a new anchor.
 UpdateAnchorRequest  — all fields optional for partial PATCH updates.
 AnchorResponse       — shape of anchor data returned by all endpoints.
+AnchorListItem       — lean nearby result for map/list views.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+AnchorVisibility = Literal["PUBLIC", "PRIVATE", "CIRCLE_ONLY"]
+AnchorStatus = Literal["ACTIVE", "EXPIRED", "LOCKED", "FLAGGED"]
+
+# Each tag must fit the CHAR(255) entries of the idx_anchors_tags multi-valued index
+Tag = Annotated[str, Field(max_length=255)]
 
 
 class CreateAnchorRequest(BaseModel):
@@ -19,7 +26,7 @@ class CreateAnchorRequest(BaseModel):
     latitude: float = Field(ge=-90, le=90)
     longitude: float = Field(ge=-180, le=180)
     altitude: Optional[float] = None
-    visibility: str = Field(description="PUBLIC, PRIVATE, or CIRCLE_ONLY")
+    visibility: AnchorVisibility = Field(description="PUBLIC, PRIVATE, or CIRCLE_ONLY")
     circle_id: Optional[str] = None
     # unlock_radius is clamped to 10–100 m; defaults to 50 m
     unlock_radius: int = Field(default=50, ge=10, le=100)
@@ -29,7 +36,7 @@ class CreateAnchorRequest(BaseModel):
     # expiration_time is ignored when always_active=True
     expiration_time: Optional[datetime] = None
     always_active: bool = False
-    tags: Optional[List[str]] = None
+    tags: Optional[List[Tag]] = None
     # When False, other users cannot save this anchor to their personal library.
     is_savable: bool = True
 
@@ -41,14 +48,14 @@ class UpdateAnchorRequest(BaseModel):
     latitude: Optional[float] = Field(default=None, ge=-90, le=90)
     longitude: Optional[float] = Field(default=None, ge=-180, le=180)
     altitude: Optional[float] = None
-    visibility: Optional[str] = None
+    visibility: Optional[AnchorVisibility] = None
     circle_id: Optional[str] = None
     unlock_radius: Optional[int] = Field(default=None, ge=10, le=100)
     max_unlock: Optional[int] = None
     activation_time: Optional[datetime] = None
     expiration_time: Optional[datetime] = None
     always_active: Optional[bool] = None
-    tags: Optional[List[str]] = None
+    tags: Optional[List[Tag]] = None
     is_savable: Optional[bool] = None
 
 
@@ -82,6 +89,17 @@ class AnchorResponse(BaseModel):
     is_savable: bool = True
 
 
+class AnchorListItem(BaseModel):
+    """Just enough to place an anchor on a map or in a list."""
+    anchor_id: str
+    title: str
+    latitude: float
+    longitude: float
+    # Distance in meters from the requesting user's position
+    distance_m: float
+    status: str
+
+
 class AnchorFilterOption(BaseModel):
     """Single filter option plus how many nearby anchors match it."""
     value: str
@@ -94,3 +112,9 @@ class AnchorFilterOptionsResponse(BaseModel):
     anchor_status: List[AnchorFilterOption]
     content_type: List[AnchorFilterOption]
     tags: List[AnchorFilterOption]
+
+
+# List serializers for the /nearby endpoints: pydantic-core writes the JSON bytes
+# for the whole page in one call instead of FastAPI encoding each item.
+ANCHOR_LIST_ADAPTER = TypeAdapter(List[AnchorResponse])
+ANCHOR_LIST_ITEM_ADAPTER = TypeAdapter(List[AnchorListItem])
@@ -1,10 +1,48 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+import re
+from typing import Annotated, Optional
+
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints
+
+
+# ── Email ─────────────────────────────────────────────────────────────────────
+EMAIL_MAX_LENGTH = 254
+EMAIL_LOCAL_MAX_LENGTH = 64
+# Unquoted local part (dot-separated atoms, no leading, trailing or doubled dots)
+# and a domain of two or more labels that neither start nor end with a hyphen,
+# ending in a top-level label that starts with a letter
+_EMAIL_RE = re.compile(
+    r"""
+    [A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+
+    (?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*
+    @
+    (?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+
+    [A-Za-z](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?
+    """,
+    re.VERBOSE,
+)
+
+
+def _fast_email_check(value: str) -> str:
+    """
+    Syntax-only email check for the auth hot path — one precompiled regex,
+    no DNS. The domain is lowercased like EmailStr did, so existing rows
+    still match.
+    """
+    value = value.strip()
+    if len(value) > EMAIL_MAX_LENGTH or not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    if len(local) > EMAIL_LOCAL_MAX_LENGTH:
+        raise ValueError("value is not a valid email address")
+    return f"{local}@{domain.lower()}"
+
+
+Email = Annotated[str, AfterValidator(_fast_email_check)]
 
 
 # ── Register ──────────────────────────────────────────────────────────────────
 class RegisterRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str = Field(min_length=8, description="Minimum 8 characters")
     username: str = Field(min_length=3, max_length=50)
 
@@ -20,7 +58,7 @@ class RegisterResponse(BaseModel):
 
 # ── Login ─────────────────────────────────────────────────────────────────────
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -74,7 +112,7 @@ class LogoutRequest(BaseModel):
 
 # ── Password reset ────────────────────────────────────────────────────────────
 class PasswordResetRequest(BaseModel):
-    email: EmailStr
+    email: Email
 
 
 class PasswordResetRequestResponse(BaseModel):
@@ -82,8 +120,22 @@ class PasswordResetRequestResponse(BaseModel):
     reset_token: Optional[str] = None
 
 
+# Reset tokens come from secrets.token_urlsafe, so anything outside the URL-safe
+# alphabet is rejected here. Surrounding whitespace from a pasted link is dropped.
+# The handler only ever looks up the token's SHA-256, never compares it directly.
+ResetToken = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=10,
+        max_length=255,
+        pattern=r"^[A-Za-z0-9_-]+$",
+    ),
+]
+
+
 class PasswordResetConfirmRequest(BaseModel):
-    token: str = Field(min_length=10, max_length=255)
+    token: ResetToken
     new_password: str = Field(min_length=8, description="Minimum 8 characters")
 
 
@@ -1,17 +1,22 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
+from app.schemas.auth import Email
+
 
 class UpdateProfileRequest(BaseModel):
     username: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     bio: Optional[str] = None
     avatar_url: Optional[str] = None
     is_ghost_mode: Optional[bool] = None
 
 
 class ProfileResponse(BaseModel):
+    # Built straight from a users row with model_validate(row)
+    model_config = ConfigDict(from_attributes=True)
+
     user_id: str
     email: str
     username: str
@@ -25,6 +30,8 @@ class BlockUserRequest(BaseModel):
 
 
 class BlockedUserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     user_id: str
     username: str
     avatar_url: Optional[str] = None
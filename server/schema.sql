@@ -13,27 +13,30 @@ CREATE TABLE IF NOT EXISTS users (
     is_banned       BOOLEAN         NOT NULL DEFAULT FALSE,
     oauth_provider  VARCHAR(50)     NULL,                       
     oauth_provider_id VARCHAR(255)  NULL,
-    reset_token     VARCHAR(255)    NULL,                       
+    reset_token     VARCHAR(255)    NULL,                       -- SHA-256 hex of the emailed token
     reset_token_expiry DATETIME     NULL,
     last_login      DATETIME        NULL,
     created_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
 
-    INDEX idx_users_email (email),
-    INDEX idx_users_username (username)
+    -- email and username lookups use their UNIQUE indexes; password reset
+    -- confirmation looks users up by reset_token
+    INDEX idx_users_reset_token (reset_token)
 );
 
 CREATE TABLE IF NOT EXISTS user_sessions (
     session_id      CHAR(36)        PRIMARY KEY,                
     user_id         CHAR(36)        NOT NULL,
-    token           VARCHAR(512)    UNIQUE NOT NULL,            
+    token_hash      BINARY(32)      UNIQUE NOT NULL,            -- SHA-256 of the refresh token
     device_info     VARCHAR(255)    NULL,                       
     created_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
     expires_at      DATETIME        NULL,
     revoked_at      DATETIME        NULL,
 
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
-    INDEX idx_sessions_user_id (user_id)
+    -- token_hash lookups use the UNIQUE index above; this one serves revoking all of a
+    -- user's active sessions (user_id + revoked_at IS NULL) and the foreign key
+    INDEX idx_sessions_user_active (user_id, revoked_at)
 );
 
 CREATE TABLE IF NOT EXISTS anchors (
@@ -58,6 +61,9 @@ CREATE TABLE IF NOT EXISTS anchors (
     FOREIGN KEY (circle_id) REFERENCES circles(circle_id) ON DELETE SET NULL,
     INDEX idx_anchors_creator_id (creator_id),
     INDEX idx_anchors_circle_id (circle_id),
+    INDEX idx_anchors_status_visibility (status, visibility),
+    -- Multi-valued index over the tag array for JSON_OVERLAPS / MEMBER OF filters
+    INDEX idx_anchors_tags ((CAST(tags AS CHAR(255) ARRAY))),
     SPATIAL INDEX idx_anchors_location (location)
 );
 
@@ -6,3 +6,13 @@ CREATE EVENT IF NOT EXISTS delete_expired_anchors
 ON SCHEDULE EVERY 1 DAY
 DO
   DELETE FROM anchors WHERE status = 'EXPIRED';
+
+-- Flip anchors past their expiration_time to EXPIRED off the request path
+CREATE EVENT IF NOT EXISTS expire_anchors
+ON SCHEDULE EVERY 1 MINUTE
+DO
+  UPDATE anchors
+  SET status = 'EXPIRED'
+  WHERE status = 'ACTIVE'
+    AND expiration_time IS NOT NULL
+    AND expiration_time <= UTC_TIMESTAMP();
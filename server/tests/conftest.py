@@ -0,0 +1,9 @@
+"""
+Shared pytest setup. Loaded before any test module imports the app, so
+settings read here apply to the whole suite.
+"""
+
+import os
+
+# Cheap bcrypt cost (4 instead of 12) — registration-heavy tests hash a lot
+os.environ.setdefault("TESTING", "1")
@@ -136,14 +136,14 @@ class TestCreateAnchor:
         assert resp.status_code in (401, 403)
 
     def test_create_invalid_visibility(self):
-        """Invalid visibility returns 400."""
+        """Invalid visibility is rejected by request validation (422)."""
         token = get_user1_token()
         resp = client.post(
             "/anchors/",
             json=make_anchor_payload(visibility="INVALID"),
             headers=auth_headers(token),
         )
-        assert resp.status_code == 400
+        assert resp.status_code == 422
 
 
 # ── Creation Time Boundary Tests ─────────────────────────────────────────────
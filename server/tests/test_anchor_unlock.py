@@ -7,7 +7,8 @@ Tests:
     - Unlock requires authentication
     - Unlock on nonexistent anchor returns 404
     - Unlock blocked before activation_time window opens
-    - Unlock blocked after expiration_time and auto-marks anchor EXPIRED
+    - Unlock blocked after expiration_time (status is left to the expire_anchors event)
+    - Past expiration_time is rejected even while status is still ACTIVE
     - Unlock blocked when max_unlock already reached
     - Anchor auto-expires after final allowed unlock
     - Unlock blocked on already-expired anchor
@@ -16,7 +17,10 @@ Tests:
 import pytest
 from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
+from sqlalchemy import text
+
 from app.main import app
+from app.core.database import SessionLocal
 
 client = TestClient(app)
 
@@ -83,6 +87,25 @@ class TestUnlockAnchor:
         assert data["unlocks"] == 1
         assert data["anchor_id"] == anchor_id
 
+    def test_unlock_right_after_create(self):
+        """activation_time defaults from the DB clock, so a new anchor unlocks immediately."""
+        token = get_token()
+        anchor = create_anchor(token, title="Fresh Anchor")
+        assert anchor["activation_time"] is not None
+
+        resp = client.post(f"/anchors/{anchor['anchor_id']}/unlock", headers=auth_headers(token))
+        assert resp.status_code == 200
+
+    def test_unlimited_anchor_never_reports_max_unlocks(self):
+        """An anchor without max_unlock keeps unlocking and never hits the cap error."""
+        token = get_token()
+        anchor = create_anchor(token, title="Unlimited Anchor", max_unlock=None)
+
+        for expected in (1, 2, 3):
+            resp = client.post(f"/anchors/{anchor['anchor_id']}/unlock", headers=auth_headers(token))
+            assert resp.status_code == 200
+            assert resp.json()["unlocks"] == expected
+
     def test_unlock_requires_auth(self):
         """POST /anchors/{id}/unlock without token returns 401."""
         token = get_token()
@@ -118,7 +141,7 @@ class TestUnlockAnchor:
         assert "not yet active" in resp.json()["detail"].lower()
 
     def test_unlock_blocked_after_expiration_time(self):
-        """US8 #2 — Unlock is blocked when past expiration_time and anchor is auto-marked EXPIRED."""
+        """US8 #2 — Unlock is blocked past expiration_time; expire_anchors (tasks.sql) flips the status."""
         token = get_token()
         anchor = create_anchor(token, title="Already Expired")
         anchor_id = anchor["anchor_id"]
@@ -136,6 +159,41 @@ class TestUnlockAnchor:
         assert resp.status_code == 403
         assert "expired" in resp.json()["detail"].lower()
 
+    def test_past_expiration_rejected_while_status_still_active(self):
+        """
+        Time-based expiry is written by the expire_anchors event, not by unlock.
+        An anchor past expiration_time whose status hasn't been flipped yet is
+        still rejected, and the failed unlock leaves its status alone.
+        """
+        token = get_token()
+        anchor = create_anchor(token, title="Expired But Active")
+        anchor_id = anchor["anchor_id"]
+
+        db = SessionLocal()
+        try:
+            db.execute(
+                text("""
+                    UPDATE anchors
+                    SET status = 'ACTIVE', expiration_time = UTC_TIMESTAMP() - INTERVAL 1 HOUR
+                    WHERE anchor_id = :anchor_id
+                """),
+                {"anchor_id": anchor_id},
+            )
+            db.commit()
+
+            resp = client.post(f"/anchors/{anchor_id}/unlock", headers=auth_headers(token))
+            assert resp.status_code == 403
+            assert resp.json()["detail"] == "Anchor has expired"
+
+            db.rollback()  # fresh snapshot for the re-read
+            anchor_status = db.execute(
+                text("SELECT status FROM anchors WHERE anchor_id = :anchor_id"),
+                {"anchor_id": anchor_id},
+            ).scalar()
+            assert anchor_status == "ACTIVE"
+        finally:
+            db.close()
+
     def test_unlock_blocked_when_max_unlock_reached(self):
         """US8 #3 — Unlock is blocked when current_unlock has already hit max_unlock."""
         token = get_token()
@@ -146,12 +204,12 @@ class TestUnlockAnchor:
         first = client.post(f"/anchors/{anchor_id}/unlock", headers=auth_headers(token))
         assert first.status_code == 200
 
-        # Second unlock should be blocked — anchor is now EXPIRED
+        # Second unlock should be blocked — the first one hit max_unlock and its UPDATE set EXPIRED
         second = client.post(f"/anchors/{anchor_id}/unlock", headers=auth_headers(token))
         assert second.status_code == 403
 
     def test_anchor_auto_expires_after_final_unlock(self):
-        """US8 #3 — Anchor status becomes EXPIRED after reaching max_unlock count."""
+        """US8 #3 — The unlock that reaches max_unlock sets status EXPIRED in the same UPDATE."""
         token = get_token()
         anchor = create_anchor(token, title="Auto Expire", max_unlock=2)
         anchor_id = anchor["anchor_id"]
@@ -160,7 +218,7 @@ class TestUnlockAnchor:
         client.post(f"/anchors/{anchor_id}/unlock", headers=auth_headers(token))
         client.post(f"/anchors/{anchor_id}/unlock", headers=auth_headers(token))
 
-        # Third unlock should fail since anchor is now EXPIRED
+        # Third unlock should fail — the second one reached max_unlock and set EXPIRED
         resp = client.post(f"/anchors/{anchor_id}/unlock", headers=auth_headers(token))
         assert resp.status_code == 403
 
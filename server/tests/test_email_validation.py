@@ -0,0 +1,67 @@
+"""
+Unit tests for the Email type shared by the auth and profile schemas — no database needed.
+
+Coverage:
+- Ordinary addresses are accepted and their domain lowercased.
+- Malformed local parts and domain labels are rejected on every schema that takes an email.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.auth import LoginRequest, PasswordResetRequest, RegisterRequest
+from app.schemas.user import UpdateProfileRequest
+
+INVALID_EMAILS = [
+    "plainaddress",
+    "a..b@x.io",
+    ".a@x.io",
+    "a.@x.io",
+    '"q"@x.com',
+    "a b@x.io",
+    "a@x",
+    "a@x..io",
+    "a@-b.com",
+    "a@b-.com",
+    "a@b.c-",
+    "a@1.2",
+    "a@@x.io",
+    "a" * 65 + "@x.io",
+    "a@" + "b" * 250 + ".io",
+]
+
+
+def build_all(email: str):
+    return [
+        RegisterRequest(email=email, password="testpass123", username="tester"),
+        LoginRequest(email=email, password="testpass123"),
+        PasswordResetRequest(email=email),
+        UpdateProfileRequest(email=email),
+    ]
+
+
+@pytest.mark.parametrize("email", ["user@example.com", "first.last+tag@mail.example.co"])
+def test_valid_email_accepted(email):
+    for model in build_all(email):
+        assert model.email == email
+
+
+def test_domain_is_lowercased_and_whitespace_stripped():
+    for model in build_all("  Mixed.Case@Example.COM "):
+        assert model.email == "Mixed.Case@example.com"
+
+
+@pytest.mark.parametrize("email", INVALID_EMAILS)
+def test_invalid_email_rejected(email):
+    for schema, extra in (
+        (RegisterRequest, {"password": "testpass123", "username": "tester"}),
+        (LoginRequest, {"password": "testpass123"}),
+        (PasswordResetRequest, {}),
+        (UpdateProfileRequest, {}),
+    ):
+        with pytest.raises(ValidationError):
+            schema(email=email, **extra)
+
+
+def test_profile_update_without_email_is_allowed():
+    assert UpdateProfileRequest(username="tester").email is None
@@ -15,6 +15,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import text
 
 from app.main import app
+from app.api.anchor import _nearby_bbox_wkt
 from app.core.database import SessionLocal
 
 client = TestClient(app)
@@ -397,6 +398,64 @@ class TestNearbyAnchors:
         assert visibility_counts["PRIVATE"] >= 1
         assert content_counts["LINK"] >= 1
 
+    def test_nearby_summary_returns_lean_items(self):
+        """GET /anchors/nearby/summary returns only map fields, closest first."""
+        token = get_token()
+        create_anchor(token, "Summary Close", lat=40.4237, lon=-86.9212)
+        create_anchor(token, "Summary Far", lat=40.4300, lon=-86.9300)
+
+        response = client.get(
+            "/anchors/nearby/summary",
+            params={"lat": 40.4237, "lon": -86.9212, "radius_km": 50},
+            headers=auth_headers(token),
+        )
+        assert response.status_code == 200
+        items = response.json()
+        assert len(items) >= 2
+        assert set(items[0]) == {"anchor_id", "title", "latitude", "longitude", "distance_m", "status"}
+
+        distances = [item["distance_m"] for item in items]
+        assert distances == sorted(distances)
+
+    def test_nearby_pagination_with_cursor(self):
+        """limit caps the page and X-Next-Cursor fetches the following page without overlap."""
+        token = get_token()
+        create_anchor(token, "Page One", lat=40.4237, lon=-86.9212)
+        create_anchor(token, "Page Two", lat=40.4238, lon=-86.9213)
+
+        params = {"lat": 40.4237, "lon": -86.9212, "radius_km": 50, "limit": 1}
+        first = client.get("/anchors/nearby", params=params, headers=auth_headers(token))
+        assert first.status_code == 200
+        assert len(first.json()) == 1
+        cursor = first.headers.get("X-Next-Cursor")
+        assert cursor
+
+        second = client.get(
+            "/anchors/nearby",
+            params={**params, "cursor": cursor},
+            headers=auth_headers(token),
+        )
+        assert second.status_code == 200
+        assert len(second.json()) == 1
+        assert second.json()[0]["anchor_id"] != first.json()[0]["anchor_id"]
+
+    def test_nearby_rejects_invalid_cursor_and_large_radius(self):
+        """A malformed cursor is a 400; radius_km beyond the cap fails validation."""
+        token = get_token()
+        bad_cursor = client.get(
+            "/anchors/nearby",
+            params={"lat": 40.4237, "lon": -86.9212, "cursor": "not-a-cursor"},
+            headers=auth_headers(token),
+        )
+        assert bad_cursor.status_code == 400
+
+        too_far = client.get(
+            "/anchors/nearby",
+            params={"lat": 40.4237, "lon": -86.9212, "radius_km": 10000},
+            headers=auth_headers(token),
+        )
+        assert too_far.status_code == 422
+
     def test_no_results_outside_radius(self):
         """Returns empty list when no anchors are within radius."""
         token = get_token()
@@ -478,3 +537,41 @@ class TestLocationBasedDiscovery:
         )
         assert response.status_code == 200
         assert response.json() == []
+
+    def test_search_near_pole_returns_ok(self):
+        """A search whose bounding box would reach past the pole still succeeds."""
+        token = get_token()
+
+        response = client.get(
+            "/anchors/nearby",
+            params={"lat": 89.99, "lon": 0.0, "radius_km": 5},
+            headers=auth_headers(token),
+        )
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+
+
+class TestNearbyBoundingBox:
+
+    def test_box_contains_search_center(self):
+        """An ordinary search gets a box around the user's position."""
+        wkt = _nearby_bbox_wkt(40.4237, -86.9212, 5000)
+        assert wkt is not None
+        corners = [
+            tuple(map(float, pair.split()))
+            for pair in wkt[len("POLYGON(("):-len("))")].split(", ")
+        ]
+        lons = [lon for lon, _ in corners]
+        lats = [lat for _, lat in corners]
+        assert min(lons) < -86.9212 < max(lons)
+        assert min(lats) < 40.4237 < max(lats)
+
+    def test_no_box_past_the_poles(self):
+        """Boxes that would leave the latitude range fall back to the distance filter."""
+        assert _nearby_bbox_wkt(89.99, 0.0, 5000) is None
+        assert _nearby_bbox_wkt(-89.99, 0.0, 5000) is None
+
+    def test_no_box_across_the_antimeridian(self):
+        """Boxes that would wrap the antimeridian fall back to the distance filter."""
+        assert _nearby_bbox_wkt(0.0, 179.99, 5000) is None
+        assert _nearby_bbox_wkt(0.0, -179.99, 5000) is None
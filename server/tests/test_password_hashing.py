@@ -0,0 +1,53 @@
+"""
+Unit tests for password hashing — no database needed.
+
+Coverage:
+- Peppered hashes round-trip through verify_password.
+- Legacy plain-bcrypt hashes still verify and are flagged for rehash.
+- A hash made under one pepper fails verification under another.
+"""
+
+import uuid
+
+import bcrypt
+
+from app.core import security
+from app.core.security import (
+    PEPPERED_HASH_PREFIX,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+def unique_password() -> str:
+    return f"pw-{uuid.uuid4().hex}"
+
+
+def test_peppered_hash_round_trips():
+    password = unique_password()
+    hashed = hash_password(password)
+
+    assert hashed.startswith(PEPPERED_HASH_PREFIX)
+    assert verify_password(password, hashed)
+    assert not verify_password(password + "x", hashed)
+    assert not password_needs_rehash(hashed)
+
+
+def test_legacy_bcrypt_hash_verifies_and_needs_rehash():
+    password = unique_password()
+    legacy = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+    assert verify_password(password, legacy)
+    assert not verify_password(password + "x", legacy)
+    assert password_needs_rehash(legacy)
+
+
+def test_wrong_pepper_fails_verification(monkeypatch):
+    password = unique_password()
+    hashed = hash_password(password)
+
+    other = security.settings.model_copy(update={"PASSWORD_PEPPER": "a-different-pepper"})
+    monkeypatch.setattr(security, "settings", other)
+
+    assert not verify_password(password, hashed)
@@ -0,0 +1,66 @@
+"""
+Unit tests for JWT decoding — no database needed.
+
+Coverage:
+- An expired token is rejected, including after it was cached as valid.
+- Refresh tokens are not accepted as access tokens, and vice versa.
+- A tampered token is rejected.
+"""
+
+import time
+import uuid
+
+from app.core import security
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_access_token,
+    decode_refresh_token,
+)
+
+
+def test_expired_token_rejected_even_when_cached(monkeypatch):
+    user_id = str(uuid.uuid4())
+    token = security._create_token({"sub": user_id, "type": "access"}, ttl_seconds=60)
+
+    # First decode caches the payload
+    assert decode_access_token(token) == user_id
+
+    # Jump past exp; the cached payload must be re-checked, not trusted
+    real_time = time.time
+    monkeypatch.setattr(security.time, "time", lambda: real_time() + 120)
+    assert decode_access_token(token) is None
+
+
+def test_expired_token_rejected_on_first_decode():
+    token = security._create_token({"sub": str(uuid.uuid4()), "type": "access"}, ttl_seconds=-10)
+    assert decode_access_token(token) is None
+
+
+def test_refresh_token_rejected_as_access_token():
+    user_id = str(uuid.uuid4())
+    refresh_token = create_refresh_token(user_id)
+
+    assert decode_refresh_token(refresh_token) == user_id
+    assert decode_access_token(refresh_token) is None
+
+
+def test_access_token_rejected_as_refresh_token():
+    user_id = str(uuid.uuid4())
+    access_token = create_access_token(user_id)
+
+    assert decode_access_token(access_token) == user_id
+    assert decode_refresh_token(access_token) is None
+
+
+def test_tampered_token_rejected():
+    user_id = str(uuid.uuid4())
+    token = create_access_token(user_id)
+    assert decode_access_token(token) == user_id
+
+    header, payload, signature = token.split(".")
+    flipped = "A" if signature[0] != "A" else "B"
+    assert decode_access_token(f"{header}.{payload}.{flipped}{signature[1:]}") is None
+
+    other = create_access_token(str(uuid.uuid4()))
+    assert decode_access_token(f"{header}.{other.split('.')[1]}.{signature}") is None